@@ -34,9 +34,12 @@ except ImportError:
     HAS_CLIPBOARD = False
 
 from MonitorTracking import HeadMouseTracker
-from VoiceControl import VoskMicRecognizer
+from CursorCircle import CursorOverlay
+from VoiceControl import MODEL_CACHE, VoskMicRecognizer
 from Chatbot import HaloChat
 
+VOICE_MODEL = "language_models/eng_model"
+
 class DragButton(QPushButton):
     """Button that can be dragged when sidebar is collapsed"""
     def __init__(self, text, parent):
@@ -202,6 +205,8 @@ class VoiceController(QObject):
     
     update_chat_input = Signal(str)
     shutdown = Signal()
+    model_ready = Signal()
+    model_failed = Signal(str)
     
     def __init__(self):
         super().__init__()
@@ -260,6 +265,13 @@ class VoiceController(QObject):
             except Exception as e:
                 print(f"Scroll down error: {e}")
 
+class TrackerSignals(QObject):
+    """Carries head tracker events from worker threads to the GUI thread"""
+    ready = Signal(object)  # the prepare future that finished
+    failed = Signal(str)
+    stopped = Signal(bool)
+
+
 class HelpDialog(QDialog):
     """Help dialog showing available functions and voice commands"""
     
@@ -392,6 +404,49 @@ class HelpDialog(QDialog):
 
 class HaloApp(QMainWindow):
     """Main HALO application window with collapsible sidebar"""
+
+    # Wake words said before a voice command ("halo" is often heard as the others)
+    VOICE_WAKE_WORDS = ("halo", "hello", "hey")
+
+    # Voice command table: command -> spoken phrases (also the command grammar)
+    VOICE_COMMANDS = {
+        "shutdown": ["halo close", "halo shut down", "halo shutdown", "halo off",
+                     "hello close", "hello shut down", "hello shutdown", "hello off",
+                     "hey close", "hey shut down", "hey shutdown", "hey off"],
+        "deactivate": ["halo deactivate", "hello deactivate", "hey deactivate",
+                       "halo deactivate all", "hello deactivate all", "hey deactivate all"],
+        "copy": ["halo copy", "hello copy", "hey copy", "halo copy text", "hello copy text", "hey copy text"],
+        "paste": ["halo paste", "hello paste", "hey paste", "halo paste text", "hello paste text", "hey paste text"],
+        "enter": ["halo enter", "hello enter", "hey enter", "halo return", "hello return", "hey return",
+                  "enter", "return"],
+        "new_tab": ["halo new tab", "hello new tab", "hey new tab", "halo open tab", "hello open tab", "hey open tab"],
+        "close_tab": ["halo close tab", "hello close tab", "hey close tab"],
+        "close_window": ["halo close window", "hello close window", "hey close window"],
+        "type": ["halo type", "hello type", "hey type"],
+        "help": ["halo help", "hello help", "hey help", "halo chat", "hello chat", "hey chat"],
+        "back": ["halo back", "hello back", "hey back", "halo remove", "hello remove"],
+        "redo": ["halo redo", "hello redo", "hey redo", "halo repeat", "hello repeat"],
+        "insert": ["halo in", "hello in", "hey in", "halo insert", "hello insert"],
+        "stop": ["halo stop", "halo done", "hello stop", "hello done", "hey stop", "hey done",
+                 "halo finish", "hello finish"],
+    }
+
+    # Common mishearings, matched only when decoding free-form (never in the grammar)
+    VOICE_ALIASES = {
+        "copy": ["halo coffee", "hello coffee", "hey coffee"],
+        "paste": ["halo piece"],
+        "type": ["hey will type", "hello will type", "he'll type"],
+        "help": ["he will help"],
+        "back": ["hey look back", "he looked back"],
+        "redo": ["halo we do", "hillary do"],
+        "stop": ["halo don't", "hey hilton", "he looked on"],
+    }
+
+    # Mouse commands for the grammar, with or without a wake word
+    VOICE_MOUSE_COMMANDS = [
+        "click", "left click", "right click", "middle click", "middle mouse",
+        "shift click", "double click", "double tap", "scroll up", "scroll down",
+    ]
     def __init__(self):
         super().__init__()
         self.setWindowTitle("HALO Control Panel")
@@ -430,6 +485,10 @@ class HaloApp(QMainWindow):
         self.setup_ui()
         self.load_stylesheet()
         self.start_chat()
+        self.setup_tracker()
+        self.use_command_grammar = QSettings("HALO", "VegieBot").value("voice_command_grammar", True, type=bool)
+        self.voice_model_future = None
+        self.preload_voice_model()
         
         QTimer.singleShot(1000, self.maybe_show_startup_help)
         
@@ -633,6 +692,8 @@ class HaloApp(QMainWindow):
         vc.finish_ai_typing.connect(self.finish_ai_typing)
         vc.add_ai_word.connect(self.add_to_ai_sentence)
         vc.shutdown.connect(self.graceful_shutdown)
+        vc.model_ready.connect(self.start_voice)
+        vc.model_failed.connect(self.on_voice_model_failed)
         
         
         
@@ -839,14 +900,12 @@ class HaloApp(QMainWindow):
             self.voice_btn.blockSignals(False)
             print("Voice recognition stopped")
         
-        # Step 4: Stop face tracking (force stop the tracker thread)
+        # Step 4: Stop face tracking in the background; exit waits for it
+        self.hide_overlay()
+        tracker_stop = None
         if hasattr(self, 'tracker') and self.tracker:
-            try:
-                self.tracker.stop()
-                self.tracker = None
-                print("Face tracker thread stopped")
-            except Exception as e:
-                print(f"Error stopping tracker: {e}")
+            tracker_stop = self.tracker.stop_async(deadline=2.0)
+            self.tracker = None
         
         # Also uncheck the face tracking button
         if self.states.get('face_tracking', False):
@@ -878,7 +937,12 @@ class HaloApp(QMainWindow):
             self.voice_window.close()
             print("Voice window closed")
         
-        # Step 8: Force exit with more aggressive methods
+        # Step 8: Force exit with more aggressive methods, once the camera
+        # is released or the tracker stop deadline has passed
+        if tracker_stop is not None:
+            self.exit_after_tracker_stop = True
+            tracker_stop.add_done_callback(self.emit_tracker_stopped)
+            return
         print("Forcing application exit...")
         self.force_exit()  # Direct call instead of using QTimer
         
@@ -1073,6 +1137,9 @@ class HaloApp(QMainWindow):
 
     def handle_voice_result(self, result_json: str):
         text = json.loads(result_json).get("text", "").strip().lower()
+        # "[unk]" marks speech outside the command grammar; never act on it
+        if not text or "[unk]" in text:
+            return
         print(f"Voice detected: '{text}'")  # Debug output
         
         # Process voice typing commands
@@ -1143,19 +1210,19 @@ class HaloApp(QMainWindow):
         """Process voice typing commands. Returns True if command was processed."""
         
         # Check for shutdown commands (highest priority)
-        if self.matches_command(text, ["halo close", "halo shut down", "halo shutdown", "halo off", "hello close", "hello shut down", "hello shutdown", "hello off", "hey close", "hey shut down", "hey shutdown", "hey off"]):
+        if self.matches_command(text, self.command_phrases("shutdown")):
             print("Voice shutdown command detected")
             self.voice_controller.shutdown.emit()
             return True
         
         # Deactivate all features
-        if self.matches_command(text, ["halo deactivate", "hello deactivate", "hey deactivate", "halo deactivate all", "hello deactivate all", "hey deactivate all"]):
+        if self.matches_command(text, self.command_phrases("deactivate")):
             print("Voice deactivate all command detected")
             self.deactivate_all_toggles()
             return True
         
         # Copy chatbot text
-        if self.matches_command(text, ["halo copy", "hello copy", "hey copy", "halo copy text", "hello copy text", "hey copy text", "halo coffee", "hello coffee", "hey coffee"]):
+        if self.matches_command(text, self.command_phrases("copy")):
             print("Voice copy command detected")
             self.copy_chatbot_text()
             return True
@@ -1167,41 +1234,41 @@ class HaloApp(QMainWindow):
             return True
         
         # Press Enter key (works with or without halo prefix)
-        if self.matches_command(text, ["halo enter", "hello enter", "hey enter", "halo return", "hello return", "hey return", "enter", "return"]):
+        if self.matches_command(text, self.command_phrases("enter")):
             print("Voice enter command detected")
             self.press_enter_key()
             return True
         
         # Open new tab
-        if self.matches_command(text, ["halo new tab", "hello new tab", "hey new tab", "halo open tab", "hello open tab", "hey open tab"]):
+        if self.matches_command(text, self.command_phrases("new_tab")):
             print("Voice new tab command detected")
             self.open_new_tab()
             return True
         
         # Close tab
-        if self.matches_command(text, ["halo close tab", "hello close tab", "hey close tab"]):
+        if self.matches_command(text, self.command_phrases("close_tab")):
             print("Voice close tab command detected")
             self.close_tab()
             return True
         
         # Close window
-        if self.matches_command(text, ["halo close window", "hello close window", "hey close window"]):
+        if self.matches_command(text, self.command_phrases("close_window")):
             print("Voice close window command detected")
             self.close_window()
             return True
         
         # Start voice typing
-        if self.matches_command(text, ["halo type", "hello type", "hey will type", "hello will type", "hey type", "he'll type"]):
+        if self.matches_command(text, self.command_phrases("type")):
             self.voice_controller.start_typing.emit()
             return True
             
         # Start AI chat typing
-        if self.matches_command(text, ["halo help", "hello help", "hey help", "he will help", "halo chat", "hello chat", "hey chat"]):
+        if self.matches_command(text, self.command_phrases("help")):
             self.voice_controller.start_ai_typing.emit()
             return True
             
         # Remove one word
-        if self.matches_command(text, ["halo back", "hello back", "hey back", "hey look back", "he looked back", "halo remove", "hello remove"]):
+        if self.matches_command(text, self.command_phrases("back")):
             if self.voice_controller.voice_typing:
                 self.voice_controller.back.emit()
             elif self.voice_controller.ai_typing:
@@ -1215,7 +1282,7 @@ class HaloApp(QMainWindow):
             return False
             
         # Redo entire sentence
-        if self.matches_command(text, ["halo redo", "halo we do", "hello redo", "hey redo", "halo repeat", "hello repeat", "hillary do"]):
+        if self.matches_command(text, self.command_phrases("redo")):
             if self.voice_controller.voice_typing:
                 self.voice_controller.redo.emit()
             elif self.voice_controller.ai_typing:
@@ -1223,7 +1290,7 @@ class HaloApp(QMainWindow):
             return True
             
         # Insert current text and clear
-        if self.matches_command(text, ["halo in", "hello in", "hey in", "halo insert", "hello insert"]):
+        if self.matches_command(text, self.command_phrases("insert")):
             if self.voice_controller.voice_typing:
                 self.voice_controller.insert.emit()
             elif self.voice_controller.ai_typing:
@@ -1231,7 +1298,7 @@ class HaloApp(QMainWindow):
             return True
             
         # Stop typing and finalize
-        if self.matches_command(text, ["halo stop", "halo done", "halo don't", "hello stop", "hello done", "hey stop", "hey done", "hey hilton", "he looked on", "halo finish", "hello finish"]):
+        if self.matches_command(text, self.command_phrases("stop")):
             if self.voice_controller.voice_typing:
                 self.voice_controller.finish_typing.emit()
             elif self.voice_controller.ai_typing:
@@ -1248,6 +1315,33 @@ class HaloApp(QMainWindow):
             
         return False
     
+    def command_phrases(self, name: str) -> list:
+        """All spoken forms of a command, including its mishearings"""
+        return self.VOICE_COMMANDS[name] + self.VOICE_ALIASES.get(name, [])
+
+    def command_grammar(self) -> list:
+        """Phrase list for grammar-constrained recognition in command mode"""
+        phrases = []
+        for words in self.VOICE_COMMANDS.values():
+            phrases += words
+        for words in self.VOICE_MOUSE_COMMANDS:
+            phrases.append(words)
+            phrases += [f"{wake} {words}" for wake in self.VOICE_WAKE_WORDS]
+        return sorted(set(phrases))
+
+    def update_voice_grammar(self):
+        """Decode against the command grammar, except while dictating"""
+        recognizer = getattr(self, 'recognizer', None)
+        if recognizer is not None:
+            recognizer.set_grammar(self.current_voice_grammar())
+
+    def current_voice_grammar(self):
+        """Command phrases in command mode, None (free-form) while typing"""
+        vc = self.voice_controller
+        if not self.use_command_grammar or vc.voice_typing or vc.ai_typing:
+            return None
+        return self.command_grammar()
+
     def matches_command(self, text: str, commands: list) -> bool:
         """Check if text matches any of the command variations"""
         text_lower = text.lower().strip()
@@ -1274,15 +1368,7 @@ class HaloApp(QMainWindow):
         text_lower = text.lower().strip()
         
         # Exact matches for paste command
-        paste_commands = [
-            "halo paste",
-            "halo piece",
-            "hello paste", 
-            "hey paste",
-            "halo paste text",
-            "hello paste text",
-            "hey paste text"
-        ]
+        paste_commands = self.command_phrases("paste")
         
         # Check for exact matches first
         for command in paste_commands:
@@ -1332,6 +1418,7 @@ class HaloApp(QMainWindow):
         """Start voice typing mode while preserving focus on current text box"""
         self.voice_controller.voice_typing = True
         self.voice_controller.sentence = ""
+        self.update_voice_grammar()
         # Show voice window without stealing focus from the currently selected text box
         self.voice_window.show_typing_window()
         self.voice_window.update_sentence("")
@@ -1492,6 +1579,7 @@ class HaloApp(QMainWindow):
         """Stop voice typing mode"""
         self.voice_controller.voice_typing = False
         self.voice_controller.sentence = ""
+        self.update_voice_grammar()
         self.voice_window.hide_typing_window()
         print("Voice typing mode stopped")
     
@@ -1509,6 +1597,7 @@ class HaloApp(QMainWindow):
             
         self.voice_controller.ai_typing = True
         self.voice_controller.ai_sentence = ""
+        self.update_voice_grammar()
         self.voice_window.show_typing_window()
         self.voice_window.update_sentence("")
         
@@ -1613,6 +1702,7 @@ class HaloApp(QMainWindow):
         """Stop AI chat typing mode"""
         self.voice_controller.ai_typing = False
         self.voice_controller.ai_sentence = ""
+        self.update_voice_grammar()
         self.voice_window.hide_typing_window()
         # Reset header back to normal
         self.voice_window.header.setText("🎤 Voice Typing")
@@ -1753,35 +1843,158 @@ class HaloApp(QMainWindow):
             print(f"Unknown toggle: {key}")
 
 
-    def start_face_tracking(self):
-        """Start face tracking"""
-        if not hasattr(self, 'tracker') or self.tracker is None:
+    def setup_tracker(self):
+        """Create the head tracker and warm up its face model in the background"""
+        self.tracker = None
+        settings = QSettings("HALO", "VegieBot")
+        self.keep_camera_warm = settings.value("keep_camera_warm", False, type=bool)
+        self.show_cursor_overlay = settings.value("cursor_overlay", True, type=bool)
+        self.cursor_overlay = None
+        self.tracker_signals = TrackerSignals()
+        self.tracker_signals.ready.connect(self.on_tracker_ready)
+        self.tracker_signals.failed.connect(self.on_tracker_failed)
+        self.tracker_signals.stopped.connect(self.on_tracker_stopped)
+        self.exit_after_tracker_stop = False
+        self.tracker_start_future = None
+        self.prewarm_tracker(open_source=self.keep_camera_warm)
+
+    def prewarm_tracker(self, open_source=False, start=False):
+        """Build the tracker's model (and optionally open the camera) off the GUI thread
+
+        With ``start``, on_tracker_ready starts tracking when this prepare finishes.
+        """
+        if self.tracker is None:
+            fast_mode = self.states.get('performance_mode', False)
+            self.tracker = HeadMouseTracker(fast_mode=fast_mode, render_mode="off")
+        future = self.tracker.prepare_async(open_source=open_source)
+        if start:
+            self.tracker_start_future = future
+        future.add_done_callback(self.emit_tracker_ready)
+
+    def emit_tracker_ready(self, future):
+        """Forward tracker preparation results to the GUI thread"""
+        error = future.exception()
+        if error is not None:
+            self.tracker_signals.failed.emit(str(error))
+        else:
+            self.tracker_signals.ready.emit(future)
+
+    def on_tracker_ready(self, future):
+        """Start tracking once the camera opened for the face tracking toggle is ready"""
+        tracker = self.tracker
+        if tracker is None or tracker.running:
+            return
+        if future is not self.tracker_start_future:
+            # Startup warm-up; starting here could block on the toggle's camera open
+            print("Face tracker ready")
+            return
+        self.tracker_start_future = None
+        if self.states.get('face_tracking', False):
             fast_mode = self.states.get('performance_mode', False)
-            self.tracker = HeadMouseTracker(fast_mode=fast_mode)
-            self.tracker.start(block=False)
+            tracker.set_performance_mode(fast_mode)
+            tracker.start(block=False)
+            self.show_overlay()
             mode = 'fast' if fast_mode else 'power saving'
             print(f"Face tracking started ({mode} mode)")
+        elif not self.keep_camera_warm:
+            # Switched off again while the camera opened; release it off the GUI thread
+            future = tracker.standby_async(keep_source=False)
+            future.add_done_callback(self.emit_tracker_stopped)
+
+    def on_tracker_failed(self, message):
+        """Report a tracker that could not start and switch the toggle back off"""
+        print(f"Face tracking unavailable: {message}")
+        if self.states.get('face_tracking', False):
+            self.face_btn.setChecked(False)
+
+    def emit_tracker_stopped(self, future):
+        """Forward tracker teardown completion to the GUI thread"""
+        try:
+            finished = future.result()
+        except Exception as e:
+            print(f"Error stopping tracker: {e}")
+            finished = False
+        self.tracker_signals.stopped.emit(finished)
+
+    def on_tracker_stopped(self, finished):
+        """Tracker teardown finished (or hit its deadline)"""
+        print("Face tracker thread stopped" if finished else "Face tracker stop timed out")
+        if self.exit_after_tracker_stop:
+            self.force_exit()
+
+    def show_overlay(self):
+        """Show the cursor ring, following the tracker's cursor moves"""
+        if not self.show_cursor_overlay or self.tracker is None:
+            return
+        if self.cursor_overlay is None:
+            self.cursor_overlay = CursorOverlay()
+        self.cursor_overlay.attach(self.tracker)
+        self.cursor_overlay.show()
+
+    def hide_overlay(self):
+        """Hide the cursor ring and stop following the tracker"""
+        if self.cursor_overlay is not None:
+            self.cursor_overlay.detach()
+            self.cursor_overlay.hide()
+
+    def start_face_tracking(self):
+        """Start face tracking once the model and camera are ready"""
+        if self.tracker is not None and self.tracker.running:
+            return
+        # Opens the camera in the background; on_tracker_ready starts tracking
+        self.prewarm_tracker(open_source=True, start=True)
     
     def stop_face_tracking(self):
-        """Stop face tracking"""
-        if hasattr(self, 'tracker') and self.tracker:
-            try:
-                self.tracker.stop()
-            finally:
-                self.tracker = None
+        """Stop face tracking, keeping the tracker warm for the next start"""
+        self.hide_overlay()
+        if self.tracker is not None and self.tracker.running:
+            future = self.tracker.standby_async(keep_source=self.keep_camera_warm)
+            future.add_done_callback(self.emit_tracker_stopped)
             print("Face tracking stopped")
 
 
+    def preload_voice_model(self):
+        """Load the Vosk model in the background so the voice toggle is instant"""
+        pending = self.voice_model_future
+        if pending is not None and not pending.done():
+            return
+        self.voice_model_future = MODEL_CACHE.preload(VOICE_MODEL)
+        self.voice_model_future.add_done_callback(self.on_voice_model_loaded)
+
+    def on_voice_model_loaded(self, future):
+        """Runs on the loader thread; start voice if it was switched on meanwhile"""
+        error = future.exception()
+        if error is not None:
+            self.voice_controller.model_failed.emit(str(error))
+            return
+        print("Voice model loaded")
+        self.voice_controller.model_ready.emit()
+
     def start_voice(self):
-        """Start voice recognition"""
+        """Start voice recognition once the shared model is loaded"""
+        if not self.states.get('voice', False):
+            return
+        if not MODEL_CACHE.is_loaded(VOICE_MODEL):
+            # on_voice_model_loaded calls back here when the model is ready;
+            # after a failed load, switching voice on again retries it
+            print("Voice model still loading...")
+            self.preload_voice_model()
+            return
         if not hasattr(self, 'recognizer') or self.recognizer is None:
             self.recognizer = VoskMicRecognizer(
-                model="language_models/eng_model", 
-                on_result=self.handle_voice_result
+                model=VOICE_MODEL,
+                on_result=self.handle_voice_result,
+                grammar=self.current_voice_grammar()
             )
             self.recognizer.start(background=True)
             print("Voice recognition started")
     
+    def on_voice_model_failed(self, message):
+        """Report a voice model that could not load and switch the toggle back off"""
+        print(f"Voice model failed to load: {message}")
+        if self.states.get('voice', False):
+            self.voice_btn.setChecked(False)
+
     def stop_voice(self):
         """Stop voice recognition"""
         if hasattr(self, 'recognizer') and self.recognizer:
@@ -3,65 +3,120 @@
 Based on: https://github.com/JEOresearch/EyeTracker/tree/main/HeadTracker
 """
 import sys
-import cv2
-import numpy as np
 import pyautogui
-from PyQt5 import QtWidgets, QtGui, QtCore
+from PySide6 import QtWidgets, QtGui, QtCore
 
 class CursorOverlay(QtWidgets.QWidget):
-    """Translucent cursor overlay for head tracking feedback"""
-    
-    def __init__(self, radius=30):
+    """Translucent cursor overlay for head tracking feedback
+
+    Attached to a HeadMouseTracker, the overlay moves on the tracker's
+    cursor updates. It polls the system cursor only while a physical mouse
+    is in charge: no tracker attached, or tracker mouse control disabled.
+    """
+
+    # Cursor position from the tracker's mouse thread, delivered queued
+    moved = QtCore.Signal(int, int)
+
+    # Rendered rings shared by all overlays, keyed by (radius, color, width)
+    _ring_cache = {}
+
+    def __init__(self, radius=30, color=(0, 255, 0, 255), ring_width=10, poll_interval=33):
         super().__init__()
         self.radius = radius
         self.diameter = 2 * radius + 4
+        self.color = tuple(color)
+        self.ring_width = ring_width
+        self.ring = self.ring_pixmap(radius, self.color, ring_width)
+        self.last_pos = None
+        self.tracker = None
         
         # Window setup
         self.setWindowFlags(
             QtCore.Qt.FramelessWindowHint |
             QtCore.Qt.WindowStaysOnTopHint |
             QtCore.Qt.Tool |
-            QtCore.Qt.X11BypassWindowManagerHint
+            QtCore.Qt.X11BypassWindowManagerHint |
+            QtCore.Qt.WindowTransparentForInput |
+            QtCore.Qt.WindowDoesNotAcceptFocus
         )
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
         self.setAttribute(QtCore.Qt.WA_NoSystemBackground)
         self.setFixedSize(self.diameter, self.diameter)
 
-        # Create label for overlay
-        self.label = QtWidgets.QLabel(self)
-        self.label.setGeometry(0, 0, self.diameter, self.diameter)
+        self.moved.connect(self.move_to)
+        self.emit_moved = self.moved.emit
 
-        # Update timer
-        self.timer = QtCore.QTimer()
+        # Low-rate fallback polling for a physical mouse, while shown
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(poll_interval)  # ~30 FPS
         self.timer.timeout.connect(self.update_position)
-        self.timer.start(10)  # 100 FPS
+
+    @classmethod
+    def ring_pixmap(cls, radius, color, ring_width):
+        """Return the ring pixmap, rendering it on first use"""
+        key = (radius, color, ring_width)
+        pixmap = cls._ring_cache.get(key)
+        if pixmap is None:
+            diameter = 2 * radius + 4
+            pixmap = QtGui.QPixmap(diameter, diameter)
+            pixmap.fill(QtCore.Qt.transparent)
+
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.setPen(QtGui.QPen(QtGui.QColor(*color), ring_width))
+            center = QtCore.QPointF(radius + 2, radius + 2)
+            painter.drawEllipse(center, radius - 5, radius - 5)
+            painter.end()
+
+            cls._ring_cache[key] = pixmap
+        return pixmap
+
+    def attach(self, tracker):
+        """Follow a HeadMouseTracker's cursor updates"""
+        self.detach()
+        self.tracker = tracker
+        tracker.add_cursor_listener(self.emit_moved)
+
+    def detach(self):
+        """Stop following the tracker and fall back to polling"""
+        if self.tracker is not None:
+            self.tracker.remove_cursor_listener(self.emit_moved)
+            self.tracker = None
 
     def update_position(self):
-        """Update overlay position to follow mouse cursor"""
-        x, y = pyautogui.position()
+        """Follow the system cursor while no tracker is driving it"""
+        if self.tracker is not None and self.tracker.mouse_enabled and self.tracker.running:
+            return
+        pos = pyautogui.position()
+        self.move_to(pos[0], pos[1])
+
+    def move_to(self, x, y):
+        """Center the overlay on (x, y) if it moved"""
+        if (x, y) == self.last_pos:
+            return
+        self.last_pos = (x, y)
         self.move(x - self.radius, y - self.radius)
-        self.draw_circle()
 
-    def draw_circle(self):
-        """Draw the cursor overlay circle"""
-        # Create transparent image
-        img = np.zeros((self.diameter, self.diameter, 4), dtype=np.uint8)
+    def showEvent(self, event):
+        self.timer.start()
+        super().showEvent(event)
 
-        # Draw green ring
-        center = (self.radius + 2, self.radius + 2)
-        cv2.circle(img, center, self.radius - 5, (0, 255, 0, 255), 10)
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
 
-        # Convert to Qt pixmap
-        qimg = QtGui.QImage(img.data, self.diameter, self.diameter, QtGui.QImage.Format_RGBA8888)
-        pixmap = QtGui.QPixmap.fromImage(qimg)
-        self.label.setPixmap(pixmap)
+    def paintEvent(self, event):
+        """Draw the cached ring"""
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self.ring)
+        painter.end()
 
 def main():
     """Run the cursor overlay"""
     app = QtWidgets.QApplication(sys.argv)
     overlay = CursorOverlay(radius=80)
     overlay.show()
-    sys.exit(app.exec_())
+    sys.exit(app.exec())
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,384 @@
+"""Frame sources for head tracking
+
+Every source opens lazily, hands out BGR frames with a capture timestamp,
+and can be released and opened again. Sources that are not cameras either
+pace frames to their nominal rate (realtime) or return them as fast as
+they are asked for, stamping each one with a virtual clock so filters see
+the same time steps on every run.
+
+Sources:
+    camera    - live camera through OpenCV with low-latency settings
+    video     - recorded video file
+    images    - directory or glob of still images, in sorted order
+    synthetic - rendered head sweeping through known yaw/pitch angles
+"""
+import glob
+import math
+import os
+import time
+
+import cv2
+import numpy as np
+
+
+CAMERA_BACKENDS = {
+    None: cv2.CAP_ANY,
+    "any": cv2.CAP_ANY,
+    "v4l2": cv2.CAP_V4L2,
+    "dshow": cv2.CAP_DSHOW,
+    "msmf": cv2.CAP_MSMF,
+    "avfoundation": cv2.CAP_AVFOUNDATION,
+}
+
+
+def open_camera(index, width=None, height=None, fps=None, fourcc=None, buffer_size=1, backend=None):
+    """Open a camera with low-latency settings and read back what was applied
+
+    Returns (cap, settings). Unset options keep the driver default. FOURCC
+    is applied before the frame size because V4L2 picks the available sizes
+    and rates per pixel format. The settings dict holds the values the
+    driver actually negotiated.
+    """
+    if backend not in CAMERA_BACKENDS:
+        raise ValueError(f"camera backend must be one of {list(CAMERA_BACKENDS)}, got {backend!r}")
+    cap = cv2.VideoCapture(index, CAMERA_BACKENDS[backend])
+    if not cap.isOpened():
+        raise RuntimeError(f"Camera {index} failed to open")
+
+    if fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    if width:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    if height:
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if fps:
+        cap.set(cv2.CAP_PROP_FPS, fps)
+    if buffer_size:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+
+    code = int(cap.get(cv2.CAP_PROP_FOURCC))
+    settings = {
+        "backend": cap.getBackendName(),
+        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "fps": cap.get(cv2.CAP_PROP_FPS),
+        "fourcc": "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00") or None,
+        "buffer_size": int(cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+    }
+    return cap, settings
+
+
+class FrameSource:
+    """Base class: open/release bookkeeping, pacing and timestamps
+
+    Subclasses implement _open() returning a settings dict, _read()
+    returning a frame or None at the end of the stream, and _release().
+    Unopened sources hold only their configuration, so they can be passed
+    to a worker process.
+    """
+
+    name = "base"
+
+    def __init__(self, fps=None, realtime=True, loop=False):
+        self.fps = fps
+        self.realtime = realtime
+        self.loop = loop
+        self.frames_read = 0
+        self.timestamp = None
+        self._start = None
+        self._is_open = False
+
+    @property
+    def is_open(self):
+        return self._is_open
+
+    def open(self):
+        """Open the source and return its settings"""
+        settings = self._open()
+        settings.setdefault("source", self.name)
+        settings.setdefault("realtime", self.realtime)
+        self.frames_read = 0
+        self._start = time.monotonic()
+        self._is_open = True
+        return settings
+
+    def read(self):
+        """Return (ok, frame); ok is False at the end of the stream
+
+        Sets ``timestamp`` to the frame's capture time on the monotonic
+        clock, or to its position on a virtual clock when not realtime.
+        """
+        if not self._is_open:
+            return False, None
+        frame = self._read()
+        if frame is None and self.loop and self.frames_read:
+            self._rewind()
+            frame = self._read()
+        if frame is None:
+            return False, None
+
+        if self.fps:
+            due = self._start + self.frames_read / self.fps
+            if self.realtime:
+                time.sleep(max(0.0, due - time.monotonic()))
+                self.timestamp = time.monotonic()
+            else:
+                self.timestamp = due
+        else:
+            self.timestamp = time.monotonic()
+        self.frames_read += 1
+        return True, frame
+
+    def release(self):
+        """Close the source; it can be opened again"""
+        if self._is_open:
+            self._is_open = False
+            self._release()
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _read(self):
+        raise NotImplementedError
+
+    def _rewind(self):
+        raise NotImplementedError(f"{self.name} source cannot loop")
+
+    def _release(self):
+        pass
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name})"
+
+
+class CameraSource(FrameSource):
+    """Live camera; the driver paces frames"""
+
+    name = "camera"
+
+    def __init__(self, index=0, **camera_options):
+        super().__init__(fps=None, realtime=True)
+        self.index = index
+        self.camera_options = camera_options
+        self._cap = None
+
+    def _open(self):
+        self._cap, settings = open_camera(self.index, **self.camera_options)
+        return settings
+
+    def _read(self):
+        ret, frame = self._cap.read()
+        return frame if ret else None
+
+    def _release(self):
+        try:
+            self._cap.release()
+        except Exception:
+            pass
+        self._cap = None
+
+    def __repr__(self):
+        return f"CameraSource({self.index})"
+
+
+class VideoFileSource(FrameSource):
+    """Recorded video, paced at the file's frame rate unless overridden"""
+
+    name = "video"
+
+    def __init__(self, path, realtime=True, loop=False, fps=None):
+        super().__init__(fps=fps, realtime=realtime, loop=loop)
+        self.path = path
+        self._cap = None
+
+    def _open(self):
+        self._cap = cv2.VideoCapture(self.path)
+        if not self._cap.isOpened():
+            raise RuntimeError(f"Could not open video {self.path}")
+        if not self.fps:
+            self.fps = self._cap.get(cv2.CAP_PROP_FPS) or 30.0
+        return {
+            "path": self.path,
+            "width": int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": self.fps,
+            "frames": int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+        }
+
+    def _read(self):
+        ret, frame = self._cap.read()
+        return frame if ret else None
+
+    def _rewind(self):
+        self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def _release(self):
+        self._cap.release()
+        self._cap = None
+
+    def __repr__(self):
+        return f"VideoFileSource({self.path!r})"
+
+
+class ImageSequenceSource(FrameSource):
+    """Still images from a directory or glob pattern, in sorted order"""
+
+    name = "images"
+
+    EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+    def __init__(self, path, fps=30.0, realtime=True, loop=False):
+        super().__init__(fps=fps, realtime=realtime, loop=loop)
+        self.path = path
+        self._files = []
+        self._index = 0
+
+    def _open(self):
+        if os.path.isdir(self.path):
+            files = [os.path.join(self.path, f) for f in os.listdir(self.path)]
+        else:
+            files = glob.glob(self.path)
+        self._files = sorted(f for f in files if f.lower().endswith(self.EXTENSIONS))
+        if not self._files:
+            raise RuntimeError(f"No images found at {self.path}")
+        self._index = 0
+        h, w = self._load(self._files[0]).shape[:2]
+        return {"path": self.path, "width": w, "height": h, "fps": self.fps, "frames": len(self._files)}
+
+    def _load(self, path):
+        frame = cv2.imread(path, cv2.IMREAD_COLOR)
+        if frame is None:
+            raise RuntimeError(f"Could not read image {path}")
+        return frame
+
+    def _read(self):
+        if self._index >= len(self._files):
+            return None
+        frame = self._load(self._files[self._index])
+        self._index += 1
+        return frame
+
+    def _rewind(self):
+        self._index = 0
+
+    def __repr__(self):
+        return f"ImageSequenceSource({self.path!r})"
+
+
+class SyntheticHeadSource(FrameSource):
+    """Cartoon head turning through a known yaw/pitch pattern
+
+    Frame n shows the head at yaw = yaw_amplitude * sin(2 pi t / period) and
+    pitch = pitch_amplitude * sin(2 pi t / (1.5 period)), with t = n / fps.
+    The angles of the last frame are kept in ``pose`` as ground truth.
+    Output depends only on the frame index.
+    """
+
+    name = "synthetic"
+
+    # Feature points on the head in millimetres (x right, y down, z towards camera)
+    FEATURES = {
+        "left_eye": (-32.0, -22.0, 62.0),
+        "right_eye": (32.0, -22.0, 62.0),
+        "left_brow": (-32.0, -42.0, 64.0),
+        "right_brow": (32.0, -42.0, 64.0),
+        "nose_tip": (0.0, 12.0, 92.0),
+        "nose_base": (0.0, 18.0, 74.0),
+        "mouth": (0.0, 46.0, 62.0),
+    }
+
+    def __init__(self, width=640, height=480, fps=30.0, frames=300, realtime=True, loop=False,
+                 yaw_amplitude=20.0, pitch_amplitude=10.0, period=4.0, head_scale=1.6):
+        super().__init__(fps=fps, realtime=realtime, loop=loop)
+        self.width = int(width)
+        self.height = int(height)
+        self.frames = frames
+        self.yaw_amplitude = yaw_amplitude
+        self.pitch_amplitude = pitch_amplitude
+        self.period = period
+        self.head_scale = head_scale
+        self.pose = (0.0, 0.0)
+        self._index = 0
+        self._background = None
+
+    def _open(self):
+        # Soft vertical gradient so the scene is not a flat colour
+        ramp = np.linspace(170, 110, self.height, dtype=np.float32)[:, None, None]
+        self._background = np.broadcast_to(
+            ramp * np.array([1.0, 0.95, 0.9], dtype=np.float32), (self.height, self.width, 3)
+        ).astype(np.uint8)
+        self._index = 0
+        return {"width": self.width, "height": self.height, "fps": self.fps, "frames": self.frames}
+
+    def _read(self):
+        if self.frames is not None and self._index >= self.frames:
+            return None
+        t = self._index / self.fps
+        yaw = self.yaw_amplitude * math.sin(2.0 * math.pi * t / self.period)
+        pitch = self.pitch_amplitude * math.sin(2.0 * math.pi * t / (1.5 * self.period))
+        self._index += 1
+        self.pose = (yaw, pitch)
+        return self.render(yaw, pitch)
+
+    def _rewind(self):
+        self._index = 0
+
+    def render(self, yaw, pitch):
+        """Draw the head at the given angles in degrees"""
+        frame = self._background.copy()
+        s = self.head_scale
+        cx, cy = self.width / 2.0, self.height / 2.0
+
+        a, b = math.radians(yaw), math.radians(pitch)
+        rot_y = np.array([[math.cos(a), 0, math.sin(a)], [0, 1, 0], [-math.sin(a), 0, math.cos(a)]])
+        rot_x = np.array([[1, 0, 0], [0, math.cos(b), -math.sin(b)], [0, math.sin(b), math.cos(b)]])
+        rot = rot_x @ rot_y
+
+        def project(p):
+            x, y, _ = rot @ np.asarray(p)
+            return int(round(cx + s * x)), int(round(cy + s * y))
+
+        # Head, shifted slightly with the turn so the silhouette moves too
+        center = project((0.0, 0.0, 12.0))
+        cv2.ellipse(frame, center, (int(78 * s), int(100 * s)), 0, 0, 360, (150, 180, 225), -1, cv2.LINE_AA)
+        cv2.ellipse(frame, center, (int(78 * s), int(100 * s)), 0, 0, 360, (110, 140, 190), 2, cv2.LINE_AA)
+
+        p = {k: project(v) for k, v in self.FEATURES.items()}
+        eye = (int(13 * s), int(7 * s))
+        for side in ("left", "right"):
+            cv2.ellipse(frame, p[f"{side}_eye"], eye, 0, 0, 360, (245, 245, 245), -1, cv2.LINE_AA)
+            cv2.circle(frame, p[f"{side}_eye"], int(5 * s), (60, 40, 30), -1, cv2.LINE_AA)
+            bx, by = p[f"{side}_brow"]
+            cv2.line(frame, (bx - int(14 * s), by), (bx + int(14 * s), by), (60, 60, 80), max(2, int(3 * s)), cv2.LINE_AA)
+        cv2.line(frame, p["nose_base"], p["nose_tip"], (110, 140, 190), max(2, int(2 * s)), cv2.LINE_AA)
+        nx, ny = p["nose_base"]
+        for dx in (-6, 6):
+            cv2.circle(frame, (nx + int(dx * s), ny), max(2, int(2 * s)), (80, 100, 150), -1, cv2.LINE_AA)
+        cv2.ellipse(frame, p["mouth"], (int(22 * s), int(8 * s)), 0, 0, 180, (70, 70, 160), max(2, int(3 * s)), cv2.LINE_AA)
+        return frame
+
+    def __repr__(self):
+        return f"SyntheticHeadSource({self.width}x{self.height}@{self.fps})"
+
+
+SOURCES = ("camera", "video", "images", "synthetic")
+
+
+def make_frame_source(spec=0, realtime=True, loop=False, **camera_options):
+    """Create a source from a spec
+
+    An int is a camera index, "synthetic" a rendered head, a directory or
+    glob pattern an image sequence, and any other string a video file.
+    ``camera_options`` are passed to open_camera for cameras.
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    if isinstance(spec, int):
+        return CameraSource(spec, **camera_options)
+    if not isinstance(spec, str):
+        raise ValueError(f"frame source must be a camera index, path or 'synthetic', got {spec!r}")
+    if spec == "synthetic":
+        return SyntheticHeadSource(realtime=realtime, loop=loop)
+    if os.path.isdir(spec) or glob.has_magic(spec):
+        return ImageSequenceSource(spec, realtime=realtime, loop=loop)
+    return VideoFileSource(spec, realtime=realtime, loop=loop)
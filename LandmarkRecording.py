@@ -0,0 +1,116 @@
+"""Landmark stream recording and playback
+
+A recording is a directory of numbered .npz chunks. Each chunk holds:
+    timestamps  (n,) float64   frame capture times in seconds
+    present     (n,) bool      whether a face was found in the frame
+    landmarks   (m, N, 3)      float32 frame-space points, one row per present frame
+    key_indices (5,) int       rows of the pose key points in a landmark array
+
+Chunks are written on a background thread so the tracking loop only pays
+for a copy of each frame's landmarks.
+"""
+import glob
+import os
+import threading
+
+import numpy as np
+
+
+class LandmarkRecorder:
+    """Append per-frame landmarks to a chunked recording"""
+
+    def __init__(self, path, key_indices, chunk_frames=1024, compress=True):
+        os.makedirs(path, exist_ok=True)
+        if glob.glob(os.path.join(path, "chunk_*.npz")):
+            raise RuntimeError(f"Recording already exists at {path}")
+        self.path = path
+        self.key_indices = np.asarray(key_indices, dtype=np.int64)
+        self.chunk_frames = int(chunk_frames)
+        self.compress = compress
+        self.frames = 0
+        self.chunks = 0
+        self._timestamps = []
+        self._present = []
+        self._points = []
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def record(self, timestamp, pts):
+        """Add one frame; ``pts`` is None when no face was found"""
+        with self._lock:
+            self._timestamps.append(timestamp)
+            self._present.append(pts is not None)
+            if pts is not None:
+                self._points.append(np.array(pts, dtype=np.float32))
+            self.frames += 1
+            if len(self._timestamps) >= self.chunk_frames:
+                self._flush()
+
+    def _flush(self):
+        if not self._timestamps:
+            return
+        arrays = {
+            "timestamps": np.array(self._timestamps, dtype=np.float64),
+            "present": np.array(self._present, dtype=bool),
+            "landmarks": (np.stack(self._points) if self._points
+                          else np.empty((0, len(self.key_indices), 3), dtype=np.float32)),
+            "key_indices": self.key_indices,
+        }
+        self._timestamps, self._present, self._points = [], [], []
+        name = os.path.join(self.path, f"chunk_{self.chunks:06d}.npz")
+        self.chunks += 1
+
+        # One chunk in flight at a time keeps memory bounded
+        if self._writer is not None:
+            self._writer.join()
+        save = np.savez_compressed if self.compress else np.savez
+        self._writer = threading.Thread(target=save, args=(name,), kwargs=arrays, daemon=True)
+        self._writer.start()
+
+    def close(self):
+        """Write any buffered frames and wait for the writer
+
+        Recording may continue afterwards; new frames go to the next chunk.
+        """
+        with self._lock:
+            self._flush()
+            if self._writer is not None:
+                self._writer.join()
+                self._writer = None
+
+
+class LandmarkRecording:
+    """Read a recording back frame by frame, one chunk in memory at a time"""
+
+    def __init__(self, path):
+        self.path = path
+        self.files = sorted(glob.glob(os.path.join(path, "chunk_*.npz")))
+        if not self.files:
+            raise RuntimeError(f"No landmark recording at {path}")
+        with np.load(self.files[0]) as chunk:
+            self.key_indices = chunk["key_indices"]
+        self._frames = None
+
+    def __len__(self):
+        if self._frames is None:
+            total = 0
+            for name in self.files:
+                with np.load(name) as chunk:
+                    total += len(chunk["timestamps"])
+            self._frames = total
+        return self._frames
+
+    def __iter__(self):
+        """Yield (timestamp, landmarks or None) for every frame"""
+        for name in self.files:
+            with np.load(name) as chunk:
+                timestamps = chunk["timestamps"]
+                present = chunk["present"]
+                landmarks = chunk["landmarks"]
+            j = 0
+            for ts, found in zip(timestamps, present):
+                if found:
+                    yield float(ts), landmarks[j]
+                    j += 1
+                else:
+                    yield float(ts), None
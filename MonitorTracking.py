@@ -5,60 +5,880 @@ Based on: https://github.com/JEOresearch/EyeTracker/tree/main/HeadTracker
 import cv2
 import mediapipe as mp
 import numpy as np
-from collections import deque
-import pyautogui
 import math
 import threading
 import time
-import keyboard
+from concurrent.futures import Future
+
+from FrameSources import make_frame_source
+# open_camera and CAMERA_BACKENDS lived here before FrameSources; re-exported
+from FrameSources import CAMERA_BACKENDS, open_camera  # noqa: F401
+from LandmarkRecording import LandmarkRecorder, LandmarkRecording
+from PointerBackends import PointerBackend, make_pointer_backend
+from TrackingStats import PipelineStats
+
+
+class PassThroughSmoother:
+    """No smoothing; zero group delay"""
+
+    kind = "none"
+
+    def __init__(self):
+        self.frame_interval = 0.0
+        self._last_time = None
+
+    def reset(self):
+        """Clear history"""
+        self._last_time = None
+
+    def update(self, value, timestamp=None):
+        """Add a sample and return the smoothed value"""
+        self._track_interval(timestamp)
+        return np.array(value, dtype=np.float64)
+
+    def _track_interval(self, timestamp):
+        """Keep a running estimate of the time between samples"""
+        if timestamp is None:
+            return
+        if self._last_time is not None:
+            dt = timestamp - self._last_time
+            if dt > 0:
+                if self.frame_interval == 0.0:
+                    self.frame_interval = dt
+                else:
+                    self.frame_interval += 0.1 * (dt - self.frame_interval)
+        self._last_time = timestamp
+
+    @property
+    def delay_frames(self):
+        """Group delay in samples"""
+        return 0.0
+
+    def stats(self):
+        """Return the smoother type and its group delay"""
+        return {
+            "kind": self.kind,
+            "delay_frames": self.delay_frames,
+            "delay_ms": self.delay_frames * self.frame_interval * 1000.0,
+        }
+
+
+class RunningMeanSmoother(PassThroughSmoother):
+    """Moving average over the last ``window`` samples in constant time
+
+    Keeps a ring buffer and a running sum; the sum is rebuilt once per
+    window to stop floating-point drift.
+    """
+
+    kind = "window"
+
+    def __init__(self, window=40):
+        super().__init__()
+        self.window = max(1, int(window))
+        self._buf = None
+        self._sum = None
+        self._count = 0
+        self._index = 0
+
+    def reset(self):
+        """Clear history"""
+        super().reset()
+        self._buf = None
+        self._count = 0
+        self._index = 0
+
+    def update(self, value, timestamp=None):
+        """Add a sample and return the mean of the window"""
+        self._track_interval(timestamp)
+        value = np.asarray(value, dtype=np.float64)
+        if self._buf is None:
+            self._buf = np.zeros((self.window,) + value.shape)
+            self._sum = np.zeros(value.shape)
+
+        if self._count == self.window:
+            self._sum -= self._buf[self._index]
+        else:
+            self._count += 1
+        self._buf[self._index] = value
+        self._sum += value
+        self._index = (self._index + 1) % self.window
+        if self._index == 0:
+            self._sum = self._buf[:self._count].sum(axis=0)
+        return self._sum / self._count
+
+    @property
+    def delay_frames(self):
+        """Group delay in samples"""
+        return (self.window - 1) / 2.0
+
+
+class EmaSmoother(PassThroughSmoother):
+    """Exponential moving average with weight ``alpha`` on the new sample"""
+
+    kind = "ema"
+
+    def __init__(self, alpha=0.5):
+        super().__init__()
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = float(alpha)
+        self._value = None
+
+    def reset(self):
+        """Clear history"""
+        super().reset()
+        self._value = None
+
+    def update(self, value, timestamp=None):
+        """Add a sample and return the smoothed value"""
+        self._track_interval(timestamp)
+        value = np.asarray(value, dtype=np.float64)
+        if self._value is None:
+            self._value = value.copy()
+        else:
+            self._value += self.alpha * (value - self._value)
+        return self._value.copy()
+
+    @property
+    def delay_frames(self):
+        """Group delay in samples"""
+        return (1.0 - self.alpha) / self.alpha
+
+
+def make_smoother(kind, window=40, alpha=0.5):
+    """Build a smoother by name: window, ema or none"""
+    if kind == "window":
+        return RunningMeanSmoother(window)
+    if kind == "ema":
+        return EmaSmoother(alpha)
+    if kind == "none":
+        return PassThroughSmoother()
+    raise ValueError(f"smoothing must be 'window', 'ema' or 'none', got {kind!r}")
+
+
+def landmarks_to_array(landmarks, w, h, out=None):
+    """Convert MediaPipe landmarks to an (N, 3) float32 pixel-space array
+
+    Writes into ``out`` when it is large enough, otherwise allocates.
+    """
+    n = len(landmarks)
+    if out is None or len(out) < n:
+        out = np.empty((n, 3), dtype=np.float32)
+    pts = out[:n]
+    pts[:] = [(lm.x, lm.y, lm.z) for lm in landmarks]
+    pts *= (w, h, w)
+    return pts
+
+
+def face_frame(points):
+    """Face axes from the (left, right, top, bottom, front) key points
+
+    Returns (center, right_vec, up_vec, forward_vec, half_width, half_height).
+    """
+    left, right, top, bottom, _ = points
+
+    right_vec = right - left
+    w_half = np.linalg.norm(right_vec) / 2.0
+    right_vec = right_vec / (2.0 * w_half)
+
+    up_vec = top - bottom
+    h_half = np.linalg.norm(up_vec) / 2.0
+    up_vec = up_vec / (2.0 * h_half)
+
+    forward_vec = np.cross(right_vec, up_vec)
+    forward_vec = -forward_vec / np.linalg.norm(forward_vec)  # Point outward
+
+    center = points.mean(axis=0)
+    return center, right_vec, up_vec, forward_vec, w_half, h_half
+
 
+class OneEuroFilter2D:
+    """Joint 2D One Euro Filter driven by frame timestamps
 
-class OneEuroFilter:
-    """One Euro Filter for smooth mouse movement"""
+    Filters a 2-vector with a single speed-dependent cutoff, so diagonal
+    motion is smoothed the same as axis-aligned motion. The time step comes
+    from the timestamps passed to filter(); ``freq`` is only used when no
+    timestamp is given. Parameters can be changed with set_params() without
+    losing filter state.
+    """
 
-    def __init__(self, min_cutoff=1.5, beta=0.03, d_cutoff=1.0, freq=60.0):
+    def __init__(self, min_cutoff=1.5, beta=0.03, d_cutoff=1.0, freq=60.0, max_dt=0.5):
         self.min_cutoff = float(min_cutoff)
         self.beta = float(beta)
         self.d_cutoff = float(d_cutoff)
         self.freq = float(freq)
+        self.max_dt = float(max_dt)
         self.prev_x = None
         self.prev_dx = None
+        self.prev_time = None
+
+    def set_params(self, min_cutoff=None, beta=None, d_cutoff=None, freq=None):
+        """Update filter parameters, keeping the current state"""
+        if min_cutoff is not None:
+            self.min_cutoff = float(min_cutoff)
+        if beta is not None:
+            self.beta = float(beta)
+        if d_cutoff is not None:
+            self.d_cutoff = float(d_cutoff)
+        if freq is not None:
+            self.freq = float(freq)
+
+    def reset(self):
+        """Forget the filter state"""
+        self.prev_x = None
+        self.prev_dx = None
+        self.prev_time = None
 
-    def _alpha(self, cutoff):
-        """Calculate alpha for filtering"""
-        tau = 1.0 / (2.0 * math.pi * cutoff)
-        dt = 1.0 / self.freq
-        return 1.0 / (1.0 + tau / dt)
+    def filter(self, x, timestamp=None):
+        """Apply the filter to a 2-vector and return the smoothed vector"""
+        x = np.asarray(x, dtype=np.float64)
 
-    def filter(self, x):
-        """Apply One Euro Filter to input value"""
-        # Calculate derivative
         if self.prev_x is None:
-            dx = 0.0
+            self.prev_x = x.copy()
+            self.prev_dx = np.zeros_like(x)
+            self.prev_time = timestamp
+            return x
+
+        # Time step from timestamps, falling back to the nominal rate
+        if timestamp is None or self.prev_time is None:
+            dt = 1.0 / self.freq
         else:
-            dx = (x - self.prev_x) * self.freq
+            dt = timestamp - self.prev_time
+            if dt <= 0.0:
+                return self.prev_x.copy()
+            dt = min(dt, self.max_dt)
+        self.prev_time = timestamp
+        inv_2pi_dt = 1.0 / (2.0 * math.pi * dt)
 
         # Smooth derivative
-        if self.prev_dx is None:
-            smooth_dx = dx
-        else:
-            alpha_d = self._alpha(self.d_cutoff)
-            smooth_dx = alpha_d * dx + (1 - alpha_d) * self.prev_dx
+        dx = (x - self.prev_x) / dt
+        alpha_d = 1.0 / (1.0 + inv_2pi_dt / self.d_cutoff)
+        smooth_dx = alpha_d * dx + (1.0 - alpha_d) * self.prev_dx
 
-        # Dynamic cutoff frequency
-        cutoff = self.min_cutoff + self.beta * abs(smooth_dx)
-        alpha = self._alpha(cutoff)
+        # Dynamic cutoff from joint speed
+        cutoff = self.min_cutoff + self.beta * math.hypot(*smooth_dx)
+        alpha = 1.0 / (1.0 + inv_2pi_dt / cutoff)
 
         # Smooth the signal
-        if self.prev_x is None:
-            smooth_x = x
-        else:
-            smooth_x = alpha * x + (1 - alpha) * self.prev_x
+        smooth_x = alpha * x + (1.0 - alpha) * self.prev_x
 
-        # Store for next iteration
         self.prev_x = smooth_x
         self.prev_dx = smooth_dx
-        return smooth_x
+        return smooth_x.copy()
+
+
+class CursorPredictor:
+    """Extrapolates the cursor target between camera frames
+
+    Targets come in stamped with the capture time of their frame. predict()
+    extrapolates to the current time plus ``horizon``. This makes up for
+    capture and inference latency and fills the gaps between ~30 fps
+    updates.
+
+    Kinds:
+        "velocity" - constant velocity from an EMA of target deltas
+        "kalman"   - constant-velocity Kalman filter per axis
+    """
+
+    KINDS = ("velocity", "kalman")
+
+    def __init__(self, kind="kalman", horizon=0.0, max_extrapolation=0.1,
+                 velocity_alpha=0.5, process_noise=5e5, measurement_noise=4.0):
+        if kind not in self.KINDS:
+            raise ValueError(f"prediction must be one of {self.KINDS}, got {kind!r}")
+        self.kind = kind
+        self.horizon = float(horizon)
+        self.max_extrapolation = float(max_extrapolation)
+        self.velocity_alpha = float(velocity_alpha)
+        self.q = float(process_noise)
+        self.r = float(measurement_noise)
+        self.latency = 0.0
+        self.reset()
+
+    def reset(self):
+        """Forget all history"""
+        self.pos = None
+        self.vel = np.zeros(2)
+        self.time = None
+        self.P = np.diag([self.r, 1e4])
+
+    def update(self, pos, timestamp, measure_latency=True):
+        """Add a target measured at ``timestamp`` (monotonic seconds)
+
+        Pass ``measure_latency=False`` for timestamps from another clock,
+        such as a replayed recording.
+        """
+        pos = np.asarray(pos, dtype=np.float64)
+        if measure_latency:
+            lag = max(0.0, time.monotonic() - timestamp)
+            self.latency = lag if self.latency == 0.0 else self.latency + 0.1 * (lag - self.latency)
+
+        if self.pos is None:
+            self.pos, self.time = pos, timestamp
+            return
+        dt = timestamp - self.time
+        if dt <= 0.0:
+            return
+        if dt > 0.5:
+            # Long gap (face lost, idle back-off): restart from here
+            self.reset()
+            self.pos, self.time = pos, timestamp
+            return
+
+        if self.kind == "velocity":
+            inst = (pos - self.pos) / dt
+            self.vel += self.velocity_alpha * (inst - self.vel)
+            self.pos = pos
+        else:
+            # Predict (both axes share one covariance)
+            self.pos = self.pos + self.vel * dt
+            F = np.array([[1.0, dt], [0.0, 1.0]])
+            Q = self.q * np.array([[dt ** 3 / 3.0, dt ** 2 / 2.0], [dt ** 2 / 2.0, dt]])
+            self.P = F @ self.P @ F.T + Q
+
+            # Correct with the measured position
+            S = self.P[0, 0] + self.r
+            K = self.P[:, 0] / S
+            innovation = pos - self.pos
+            self.pos = self.pos + K[0] * innovation
+            self.vel = self.vel + K[1] * innovation
+            self.P = self.P - np.outer(K, self.P[0, :])
+        self.time = timestamp
+
+    def active(self, now):
+        """True while the last measurement is recent enough to extrapolate"""
+        return self.time is not None and now - self.time <= self.max_extrapolation
+
+    def predict(self, now):
+        """Predicted target at ``now + horizon``, or None before any update"""
+        if self.pos is None:
+            return None
+        ahead = min(max(0.0, now - self.time + self.horizon), self.max_extrapolation)
+        return self.pos + self.vel * ahead
+
+    def stats(self):
+        """Return predictor settings and measured input latency"""
+        return {
+            "kind": self.kind,
+            "horizon_ms": self.horizon * 1000.0,
+            "latency_ms": self.latency * 1000.0,
+            "speed_px_s": float(np.hypot(*self.vel)),
+        }
+
+
+class LatestFrameSlot:
+    """Single-entry frame buffer that always holds the newest capture
+
+    The writer overwrites whatever is in the slot; a frame that is replaced
+    before anyone reads it counts as dropped. A frame older than
+    ``stale_after`` seconds when it is read counts as stale.
+    """
+
+    def __init__(self, stale_after=0.1):
+        self.stale_after = float(stale_after)
+        self._cond = threading.Condition()
+        self._frame = None
+        self._timestamp = 0.0
+        self._seq = 0
+        self._read_seq = 0
+        self._closed = False
+
+        # Counters
+        self.captured = 0
+        self.dropped = 0
+        self.stale = 0
+
+    def put(self, frame, timestamp=None, wait=False):
+        """Store a frame, replacing any unread one
+
+        With ``wait`` the writer first blocks until the previous frame has
+        been read, so no frame is dropped (used for offline playback).
+        """
+        with self._cond:
+            if wait:
+                self._cond.wait_for(lambda: self._closed or self._seq == self._read_seq)
+            if self._frame is not None and self._seq != self._read_seq:
+                self.dropped += 1
+            self._frame = frame
+            self._timestamp = time.monotonic() if timestamp is None else timestamp
+            self._seq += 1
+            self.captured += 1
+            self._cond.notify_all()
+
+    def get(self, timeout=None):
+        """Wait for a frame newer than the last one read
+
+        Returns (frame, timestamp), or (None, None) on timeout or close.
+        """
+        with self._cond:
+            ready = self._cond.wait_for(
+                lambda: self._closed or self._seq != self._read_seq, timeout
+            )
+            if not ready or self._seq == self._read_seq:
+                return None, None
+            self._read_seq = self._seq
+            self._cond.notify_all()
+            if time.monotonic() - self._timestamp > self.stale_after:
+                self.stale += 1
+            return self._frame, self._timestamp
+
+    def close(self):
+        """Wake up readers; no more frames will arrive"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reset(self):
+        """Clear the slot and counters for a new capture session"""
+        with self._cond:
+            self._frame = None
+            self._seq = self._read_seq = 0
+            self._closed = False
+            self.captured = self.dropped = self.stale = 0
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def stats(self):
+        """Return frame counters"""
+        with self._cond:
+            return {
+                "captured": self.captured,
+                "dropped": self.dropped,
+                "stale": self.stale,
+            }
+
+
+class FaceLandmarkModel:
+    """MediaPipe face model selected by tier
+
+    Tiers:
+        "refined"   - FaceMesh with iris refinement (478 points)
+        "mesh"      - FaceMesh without refinement (468 points)
+        "keypoints" - BlazeFace detector (6 keypoints); the five pose points
+                      are synthesized from a rigid head model with solvePnP
+
+    process() returns normalized (N, 3) landmarks or None when no face is
+    found. For the keypoints tier N is 5, in HeadMouseTracker.KEY_ORDER.
+    """
+
+    TIERS = ("refined", "mesh", "keypoints")
+
+    # Rigid head model in camera axes (x right, y down, z away), millimetres.
+    # BlazeFace keypoint order: right eye, left eye, nose tip, mouth center,
+    # right ear tragion, left ear tragion (subject's right is image left).
+    DETECTION_MODEL = np.array([
+        [-32.0, -30.0, -10.0], [32.0, -30.0, -10.0], [0.0, 10.0, -45.0],
+        [0.0, 45.0, -20.0], [-72.0, -5.0, 60.0], [72.0, -5.0, 60.0],
+    ])
+    # Left, right, top, bottom, front in the same head model
+    KEY_MODEL = np.array([
+        [-75.0, 0.0, 10.0], [75.0, 0.0, 10.0], [0.0, -85.0, 0.0],
+        [0.0, 95.0, 0.0], [0.0, 10.0, -45.0],
+    ])
+
+    def __init__(self, tier="refined", min_detection_confidence=0.5, min_tracking_confidence=0.5):
+        if tier not in self.TIERS:
+            raise ValueError(f"model tier must be one of {self.TIERS}, got {tier!r}")
+        self.tier = tier
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.num_landmarks = {"refined": 478, "mesh": 468, "keypoints": 5}[tier]
+
+        if tier == "keypoints":
+            self.key_indices = np.arange(5)
+            self._model = mp.solutions.face_detection.FaceDetection(
+                model_selection=0,
+                min_detection_confidence=min_detection_confidence
+            )
+        else:
+            self.key_indices = HeadMouseTracker.KEY_INDICES
+            self._model = mp.solutions.face_mesh.FaceMesh(
+                static_image_mode=False,
+                max_num_faces=1,
+                refine_landmarks=(tier == "refined"),
+                min_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence
+            )
+
+        self._rvec = None
+        self._tvec = None
+
+    def process(self, rgb, out=None):
+        """Run the model on an RGB image and return normalized landmarks"""
+        results = self._model.process(rgb)
+        if self.tier == "keypoints":
+            if not results.detections:
+                self._rvec = self._tvec = None
+                return None
+            keypoints = results.detections[0].location_data.relative_keypoints
+            return self._keypoints_to_pose_points(keypoints, rgb.shape, out)
+
+        if not results.multi_face_landmarks:
+            return None
+        return landmarks_to_array(results.multi_face_landmarks[0].landmark, 1.0, 1.0, out=out)
+
+    def _keypoints_to_pose_points(self, keypoints, shape, out):
+        """Fit the head model to detector keypoints and place the pose points"""
+        h, w = shape[:2]
+        image_pts = np.array([(kp.x * w, kp.y * h) for kp in keypoints], dtype=np.float64)
+        camera = np.array([[w, 0, w / 2.0], [0, w, h / 2.0], [0, 0, 1]], dtype=np.float64)
+
+        guess = self._rvec is not None
+        ok, rvec, tvec = cv2.solvePnP(
+            self.DETECTION_MODEL, image_pts, camera, None,
+            rvec=self._rvec, tvec=self._tvec, useExtrinsicGuess=guess,
+            flags=cv2.SOLVEPNP_ITERATIVE
+        )
+        if not ok or tvec[2, 0] <= 0:
+            self._rvec = self._tvec = None
+            return None
+        self._rvec, self._tvec = rvec, tvec
+
+        # Weak-perspective placement around the projected head origin
+        rot, _ = cv2.Rodrigues(rvec)
+        scale = w / tvec[2, 0]
+        origin = camera @ tvec[:, 0]
+        rotated = (self.KEY_MODEL @ rot.T) * scale
+        rotated[:, 0] += origin[0] / origin[2]
+        rotated[:, 1] += origin[1] / origin[2]
+
+        if out is None or len(out) < 5:
+            out = np.empty((5, 3), dtype=np.float32)
+        pts = out[:5]
+        pts[:] = rotated / (w, h, w)
+        return pts
+
+    def close(self):
+        """Release the MediaPipe graph"""
+        self._model.close()
+
+    def stats(self):
+        """Return the active tier and its settings"""
+        return {
+            "tier": self.tier,
+            "num_landmarks": self.num_landmarks,
+            "min_detection_confidence": self.min_detection_confidence,
+            "min_tracking_confidence": self.min_tracking_confidence,
+        }
+
+
+class InferenceFrontEnd:
+    """Prepares camera frames for FaceMesh and maps landmarks back
+
+    Crops a padded ROI around the previous frame's face and downscales it to
+    at most ``target_width`` pixels wide. With ``adaptive`` set, the width
+    moves between ``min_width`` and ``max_width`` to keep inference close to
+    ``budget_ms``. Landmarks are always returned in full-frame pixels.
+    """
+
+    def __init__(
+        self,
+        target_width=640,
+        min_width=320,
+        max_width=960,
+        roi_crop=True,
+        roi_padding=0.35,
+        adaptive=True,
+        budget_ms=20.0,
+        width_step=64
+    ):
+        self.target_width = int(target_width)
+        self.min_width = int(min_width)
+        self.max_width = int(max_width)
+        self.roi_crop = roi_crop
+        self.roi_padding = float(roi_padding)
+        self.adaptive = adaptive
+        self.budget_ms = float(budget_ms)
+        self.width_step = int(width_step)
+
+        self.roi = None  # (x0, y0, x1, y1) in frame pixels, None = full frame
+        self.crop = (0, 0, 0, 0)  # (x0, y0, w, h) of the last prepared input
+        self.input_size = (0, 0)
+        self.infer_ms = 0.0
+
+    def reset(self):
+        """Forget the face ROI and go back to full-frame input"""
+        self.roi = None
+
+    def prepare(self, frame):
+        """Crop and downscale a BGR frame, returning the RGB model input"""
+        h, w = frame.shape[:2]
+        if self.roi_crop and self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            frame = frame[y0:y1, x0:x1]
+        else:
+            x0, y0, x1, y1 = 0, 0, w, h
+        crop_w, crop_h = x1 - x0, y1 - y0
+        self.crop = (x0, y0, crop_w, crop_h)
+
+        if crop_w > self.target_width:
+            scale = self.target_width / crop_w
+            size = (self.target_width, max(1, int(round(crop_h * scale))))
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+        self.input_size = (frame.shape[1], frame.shape[0])
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    def to_frame(self, pts):
+        """Convert normalized (N, 3) landmarks to full-frame pixels in place"""
+        x0, y0, crop_w, crop_h = self.crop
+        pts *= (crop_w, crop_h, crop_w)
+        pts[:, 0] += x0
+        pts[:, 1] += y0
+        return pts
+
+    def update(self, pts3d, frame_shape, infer_ms):
+        """Record inference time and the face box for the next frame
+
+        Pass ``pts3d=None`` when no face was found.
+        """
+        self.infer_ms = infer_ms
+        h, w = frame_shape[:2]
+
+        if pts3d is None:
+            self.roi = None
+        elif self.roi_crop:
+            x_min, y_min = pts3d[:, :2].min(axis=0)
+            x_max, y_max = pts3d[:, :2].max(axis=0)
+            pad = self.roi_padding * max(x_max - x_min, y_max - y_min)
+            self.roi = (
+                max(0, int(x_min - pad)), max(0, int(y_min - pad)),
+                min(w, int(x_max + pad)), min(h, int(y_max + pad)),
+            )
+            if self.roi[2] - self.roi[0] < 32 or self.roi[3] - self.roi[1] < 32:
+                self.roi = None
+
+        if self.adaptive:
+            if infer_ms > self.budget_ms:
+                self.target_width = max(self.min_width, self.target_width - self.width_step)
+            elif infer_ms < 0.6 * self.budget_ms:
+                self.target_width = min(self.max_width, self.target_width + self.width_step)
+
+    def stats(self):
+        """Return current input geometry and timing"""
+        return {
+            "target_width": self.target_width,
+            "input_size": self.input_size,
+            "roi": self.roi,
+            "infer_ms": self.infer_ms,
+        }
+
+
+class InferenceScheduler:
+    """Decides how often to run face inference
+
+    Runs on every frame while the head is moving. After ``idle_after``
+    frames with sub-threshold motion it drops to ``idle_rate`` probes per
+    second, and after ``idle_after`` frames without a face to
+    ``absent_rate``. Any motion or a returning face switches straight back to
+    full rate.
+    """
+
+    ACTIVE = "active"
+    STILL = "still"
+    ABSENT = "absent"
+
+    def __init__(self, enabled=True, idle_after=30, motion_threshold=1.5, idle_rate=10.0, absent_rate=2.0):
+        self.enabled = enabled
+        self.idle_after = int(idle_after)
+        self.motion_threshold = float(motion_threshold)
+        self.idle_rate = float(idle_rate)
+        self.absent_rate = float(absent_rate)
+        self.reset()
+
+    def reset(self):
+        """Return to full rate and clear history"""
+        self.state = self.ACTIVE
+        self.still_frames = 0
+        self.absent_frames = 0
+        self.last_points = None
+        self.last_run = None
+        self.rate = 0.0
+
+    def next_delay(self, now):
+        """Seconds to wait before the next inference (0 = run now)"""
+        if not self.enabled or self.state == self.ACTIVE or self.last_run is None:
+            return 0.0
+        rate = self.idle_rate if self.state == self.STILL else self.absent_rate
+        return max(0.0, self.last_run + 1.0 / rate - now)
+
+    def record(self, points, now):
+        """Update state from this frame's key points (None = no face)"""
+        if self.last_run is not None and now > self.last_run:
+            inst = 1.0 / (now - self.last_run)
+            self.rate = inst if self.rate == 0.0 else self.rate + 0.1 * (inst - self.rate)
+        self.last_run = now
+
+        if points is None:
+            self.still_frames = 0
+            self.absent_frames += 1
+            self.last_points = None
+            if self.absent_frames >= self.idle_after:
+                self.state = self.ABSENT
+            elif self.state == self.STILL:
+                self.state = self.ACTIVE
+            return
+
+        self.absent_frames = 0
+        moving = (self.last_points is None or
+                  np.abs(points - self.last_points).max() >= self.motion_threshold)
+        self.last_points = points.copy()
+
+        if moving:
+            self.still_frames = 0
+            self.state = self.ACTIVE
+        else:
+            self.still_frames += 1
+            if self.still_frames >= self.idle_after:
+                self.state = self.STILL
+
+    @property
+    def current_rate(self):
+        """Measured inference rate in Hz"""
+        return self.rate
+
+    def stats(self):
+        """Return scheduler state and measured rate"""
+        return {
+            "enabled": self.enabled,
+            "state": self.state,
+            "rate_hz": self.rate,
+        }
+
+
+class DebugVisualizer:
+    """Renders tracker snapshots in OpenCV windows on its own thread
+
+    The tracker hands over snapshots with submit(), which never blocks.
+    Drawing runs at most ``max_fps`` times per second; snapshots that arrive
+    while a frame is being drawn replace each other and count as dropped.
+    """
+
+    # Debug cube corners in face-axis units and the edges joining them
+    CUBE_SIGNS = np.array([
+        [-1, 1, -1], [1, 1, -1], [1, -1, -1], [-1, -1, -1],
+        [-1, 1, 1], [1, 1, 1], [1, -1, 1], [-1, -1, 1],
+    ], dtype=np.float64)
+    CUBE_EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4), (0, 4), (1, 5), (2, 6), (3, 7)]
+
+    def __init__(self, mode="full", max_fps=15.0, on_key=None):
+        self.mode = mode
+        self.max_fps = float(max_fps)
+        self.on_key = on_key
+
+        self.slot = LatestFrameSlot(stale_after=1.0 / self.max_fps)
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        self._outline_mask = np.zeros(HeadMouseTracker.NUM_LANDMARKS, dtype=bool)
+        self._outline_mask[HeadMouseTracker.FACE_OUTLINE] = True
+
+    def start(self):
+        """Start the render thread"""
+        self.stop_event.clear()
+        self.slot.reset()
+        self.thread = threading.Thread(target=self.render_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the render thread and close its windows"""
+        self.stop_event.set()
+        self.slot.close()
+        if (self.thread and self.thread.is_alive() and
+            self.thread != threading.current_thread()):
+            self.thread.join(timeout=1.0)
+        self.thread = None
+
+    def submit(self, frame, pts3d, pose):
+        """Queue a snapshot for drawing, replacing any undrawn one"""
+        self.slot.put((frame, pts3d, pose))
+
+    def stats(self):
+        """Return submitted/dropped/stale snapshot counters"""
+        return self.slot.stats()
+
+    def render_loop(self):
+        """Draw the newest snapshot, capped at max_fps"""
+        interval = 1.0 / self.max_fps
+        next_draw = 0.0
+        while not self.stop_event.is_set():
+            delay = next_draw - time.monotonic()
+            if delay > 0:
+                # Still service window events while waiting
+                self._poll_key(max(1, int(delay * 1000)))
+                continue
+
+            snapshot, _ = self.slot.get(timeout=interval)
+            if snapshot is None:
+                if self.slot.closed:
+                    break
+                self._poll_key(1)
+                continue
+
+            next_draw = time.monotonic() + interval
+            self.draw(*snapshot)
+            self._poll_key(1)
+
+        try:
+            cv2.destroyAllWindows()
+        except Exception:
+            pass
+
+    def _poll_key(self, delay_ms):
+        """Pump HighGUI events and forward key presses"""
+        key = cv2.waitKey(delay_ms) & 0xFF
+        if key != 0xFF and self.on_key is not None:
+            self.on_key(key)
+
+    def draw(self, frame, pts3d, pose):
+        """Draw tracking overlays and show the debug windows"""
+        if pose is None:
+            # No face detected - show frame anyway
+            cv2.imshow("Head Tracking", frame)
+            return
+
+        h, w = frame.shape[:2]
+        full = self.mode == "full"
+        debug_frame = np.zeros_like(frame) if full else None
+
+        # Draw landmarks for debugging
+        if full and pts3d is not None:
+            pix = pts3d[:, :2].astype(np.int32)
+            visible = ((pix[:, 0] >= 0) & (pix[:, 0] < w) &
+                       (pix[:, 1] >= 0) & (pix[:, 1] < h))
+            outline = self._outline_mask[:len(pix)]
+            for i in np.flatnonzero(visible):
+                color = (155, 155, 155) if outline[i] else (255, 25, 10)
+                cv2.circle(debug_frame, (int(pix[i, 0]), int(pix[i, 1])), 3, color, -1)
+            frame[pix[visible, 1], pix[visible, 0]] = (255, 255, 255)
+
+        # Key facial points
+        for x, y in pose["points"][:, :2].astype(np.int32):
+            cv2.circle(frame, (int(x), int(y)), 4, (0, 0, 0), -1)
+
+        # Draw 3D cube for visualization
+        d_half = 80.0
+        if full:
+            w_half, h_half = pose["half_size"]
+            corners = pose["center"] + (self.CUBE_SIGNS * (w_half, h_half, d_half)) @ pose["axes"]
+            corners_2d = [(int(p[0]), int(p[1])) for p in corners]
+            for i, j in self.CUBE_EDGES:
+                cv2.line(frame, corners_2d[i], corners_2d[j], (255, 125, 35), 2)
+
+        # Draw head direction ray
+        smooth_origin = pose["smooth_origin"]
+        ray_end = smooth_origin - pose["smooth_direction"] * (2.5 * d_half)
+        start_2d = (int(smooth_origin[0]), int(smooth_origin[1]))
+        end_2d = (int(ray_end[0]), int(ray_end[1]))
+        cv2.line(frame, start_2d, end_2d, (15, 255, 0), 3)
+
+        # Show windows
+        cv2.imshow("Head Tracking", frame)
+        if full:
+            cv2.line(debug_frame, start_2d, end_2d, (15, 255, 0), 3)
+            cv2.imshow("Landmarks", debug_frame)
 
 
 class HeadMouseTracker:
@@ -78,6 +898,26 @@ class HeadMouseTracker:
         "left": 234, "right": 454, "top": 10,
         "bottom": 152, "front": 1
     }
+    KEY_ORDER = ("left", "right", "top", "bottom", "front")
+    KEY_INDICES = np.array(list(map(LANDMARKS.get, KEY_ORDER)))
+
+    # Refined FaceMesh output size (468 mesh points + 10 iris points)
+    NUM_LANDMARKS = 478
+
+    # Debug rendering modes
+    RENDER_OFF = "off"          # No windows, no drawing, no waitKey
+    RENDER_MINIMAL = "minimal"  # Camera view with key points and head ray
+    RENDER_FULL = "full"        # Camera view plus landmark and cube overlays
+    RENDER_MODES = (RENDER_OFF, RENDER_MINIMAL, RENDER_FULL)
+
+    # Global hotkeys and the tracker events they post. Plain 'c' and 'q'
+    # only act inside the debug windows, where they cannot clash with typing.
+    HOTKEYS = {"f7": "toggle", "ctrl+alt+c": "calibrate", "ctrl+alt+q": "quit"}
+    WINDOW_KEYS = {ord("c"): "calibrate", ord("q"): "quit"}
+    EVENT_DEBOUNCE = 0.3
+
+    # Instrumented pipeline stages, in order
+    STAGES = ("capture", "preprocess", "inference", "pose", "filter", "inject", "frame", "end_to_end")
 
     def __init__(
         self,
@@ -89,15 +929,65 @@ class HeadMouseTracker:
         euro_beta=None,
         euro_freq=None,
         fast_mode=False,
-        allow_runtime_override=True
+        allow_runtime_override=True,
+        render_mode="full",
+        render_fps=15.0,
+        inference_width=640,
+        roi_crop=True,
+        adaptive_resolution=True,
+        model_tier="refined",
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5,
+        smoothing=None,
+        smoothing_alpha=0.5,
+        adaptive_rate=True,
+        idle_after_frames=30,
+        motion_threshold=1.5,
+        idle_rate=10.0,
+        absent_rate=2.0,
+        process_isolation=False,
+        ring_slots=4,
+        pointer_backend="pyautogui",
+        camera_width=None,
+        camera_height=None,
+        camera_fps=None,
+        camera_fourcc=None,
+        camera_buffer_size=1,
+        camera_backend=None,
+        mouse_interpolation=False,
+        prediction=None,
+        prediction_horizon=0.0,
+        source=None,
+        record_path=None,
+        hotkeys=True,
+        screen_size=None
     ):
-        # Camera settings
-        self.cap = None
+        if model_tier not in FaceLandmarkModel.TIERS:
+            raise ValueError(f"model_tier must be one of {FaceLandmarkModel.TIERS}, got {model_tier!r}")
+
+        if render_mode not in self.RENDER_MODES:
+            raise ValueError(f"render_mode must be one of {self.RENDER_MODES}, got {render_mode!r}")
+
+        # Frame source (camera by default, or a FrameSource / source spec)
         self.camera_index = camera_index
+        self.camera_options = {
+            "width": camera_width,
+            "height": camera_height,
+            "fps": camera_fps,
+            "fourcc": camera_fourcc,
+            "buffer_size": camera_buffer_size,
+            "backend": camera_backend,
+        }
+        self.source = make_frame_source(
+            camera_index if source is None else source, **self.camera_options
+        )
+        self.camera_settings = {}
         self.filter_length = filter_length
         self.yaw_range = yaw_degrees
         self.pitch_range = pitch_degrees
         self.fast_mode = fast_mode
+        self.render_mode = render_mode
+        self.render_fps = render_fps
 
         # Runtime override permission
         user_params = any([euro_min_cutoff, euro_beta, euro_freq])
@@ -117,8 +1007,11 @@ class HeadMouseTracker:
             euro_min_cutoff = euro_min_cutoff or 1.5
             euro_beta = euro_beta or 0.03
 
-        # Screen dimensions
-        self.screen_w, self.screen_h = pyautogui.size()
+        # Screen dimensions (pyautogui needs a display, so only ask it when not given)
+        if screen_size is None:
+            import pyautogui
+            screen_size = pyautogui.size()
+        self.screen_w, self.screen_h = screen_size
         self.center_x = self.screen_w // 2
         self.center_y = self.screen_h // 2
 
@@ -129,64 +1022,292 @@ class HeadMouseTracker:
         self.raw_yaw = 180.0
         self.raw_pitch = 180.0
 
-        # Smoothing buffers
-        self.origins = deque(maxlen=self.filter_length)
-        self.directions = deque(maxlen=self.filter_length)
+        # Head pose smoothing (origin and direction stacked into one vector);
+        # by default fast mode uses a short EMA, power saving a long window
+        self.user_smoothing = smoothing
+        self.smoothing_alpha = smoothing_alpha
+        self.smoother = make_smoother(
+            smoothing or ("ema" if fast_mode else "window"),
+            window=self.filter_length, alpha=smoothing_alpha
+        )
 
         # Store filter parameters
         self.euro_freq = euro_freq
         self.euro_cutoff = euro_min_cutoff
         self.euro_beta = euro_beta
 
-        # Smoothing filters
-        self.filter_x = OneEuroFilter(euro_min_cutoff, euro_beta, 1.0, euro_freq)
-        self.filter_y = OneEuroFilter(euro_min_cutoff, euro_beta, 1.0, euro_freq)
+        # Cursor smoothing filter
+        self.pointer_filter = OneEuroFilter2D(euro_min_cutoff, euro_beta, 1.0, euro_freq)
 
         # Mouse target coordinates
         self.mouse_target = [self.center_x, self.center_y]
-        self.mouse_lock = threading.Lock()
+        self.target_seq = 0
+        self.mouse_cond = threading.Condition()
+
+        # Move only on new targets, or glide towards them every mouse_sleep
+        self.mouse_interpolation = mouse_interpolation
+
+        # Optional extrapolation of the target between frames
+        self.predictor = None
+        if prediction:
+            self.predictor = CursorPredictor(prediction, horizon=prediction_horizon)
+
+        # Cursor injection (backend name or PointerBackend instance)
+        self.pointer_backend_name = pointer_backend
+        self.pointer = pointer_backend if isinstance(pointer_backend, PointerBackend) else None
+
+        # Callbacks told of every cursor position the tracker injects
+        self.cursor_listeners = []
 
         # Threading
         self.stop_event = threading.Event()
+        self.running = False
+        self._halting = False
+        self._prepare_lock = threading.Lock()
+        self._teardown_thread = None
         self.mouse_thread = None
         self.loop_thread = None
-
-        # MediaPipe face mesh
-        self.mp_face = mp.solutions.face_mesh
-        self.face_mesh = None
+        self.capture_thread = None
+
+        # Newest camera frame, shared between capture and processing
+        self.frame_slot = LatestFrameSlot()
+
+        # Per-stage latency histograms and processed-frame rate
+        self.pipeline_stats = PipelineStats(self.STAGES)
+
+        # Model input cropping and scaling
+        self.front_end = InferenceFrontEnd(
+            target_width=inference_width,
+            roi_crop=roi_crop,
+            adaptive=adaptive_resolution
+        )
+
+        # Idle back-off for inference
+        self.scheduler = InferenceScheduler(
+            enabled=adaptive_rate,
+            idle_after=idle_after_frames,
+            motion_threshold=motion_threshold,
+            idle_rate=idle_rate,
+            absent_rate=absent_rate
+        )
+
+        # Per-frame landmark buffer and the rows holding the pose key points
+        self._landmark_buf = np.empty((self.NUM_LANDMARKS, 3), dtype=np.float32)
+        self._key_indices = self.KEY_INDICES
+
+        # Optional worker process for capture and inference
+        self.process_isolation = process_isolation
+        self.ring_slots = ring_slots
+        self.worker = None
+        self.worker_conn = None
+        self.worker_stop = None
+        self.frame_ring = None
+        self.worker_stats = {}
+
+        # Global hotkeys (True for HOTKEYS, a {combo: event} dict, or False)
+        if hotkeys is True:
+            hotkeys = self.HOTKEYS
+        self.hotkeys = dict(hotkeys or {})
+        self._hotkey_handles = []
+        self._last_event = {}
+
+        # Optional landmark recording of every processed frame
+        self.record_path = record_path
+        self.recorder = None
+        self.replaying = False
+
+        # Debug windows, rendered off the tracking thread
+        self.visualizer = None
+
+        # MediaPipe face model
+        self.model_tier = model_tier
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.face_model = None
     def start(self, block=True):
         """Start head tracking"""
-        if self.face_mesh is None:
-            self.face_mesh = self.mp_face.FaceMesh(
-                static_image_mode=False,
-                max_num_faces=1,
-                refine_landmarks=True,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
+        self._wait_for_teardown()
+        self.stop_event.clear()
+        self.frame_slot.reset()
+        self.pipeline_stats.reset()
+        self.front_end.reset()
+        self.scheduler.reset()
+        self.smoother.reset()
+        self.pointer_filter.reset()
+        if self.predictor is not None:
+            self.predictor.reset()
+
+        if self.process_isolation:
+            self._start_worker()
+            loop = self.result_loop
+        else:
+            # Build the model and open the frame source unless already warm
+            self.prepare(open_source=True)
+            self._key_indices = self.face_model.key_indices
+
+            # Start camera capture thread
+            self.capture_thread = threading.Thread(target=self.capture_loop, daemon=True)
+            self.capture_thread.start()
+            loop = self.process_loop
+
+        # Start landmark recording
+        if self.record_path and self.recorder is None:
+            self.recorder = LandmarkRecorder(self.record_path, self._key_indices)
+
+        # Start debug visualizer
+        if self.render_mode != self.RENDER_OFF and self.visualizer is None:
+            self.visualizer = DebugVisualizer(
+                mode=self.render_mode, max_fps=self.render_fps, on_key=self.handle_key
             )
+            self.visualizer.start()
 
-        # Initialize camera
-        if self.cap is None:
-            self.cap = cv2.VideoCapture(self.camera_index)
-            if not self.cap.isOpened():
-                raise RuntimeError(f"Camera {self.camera_index} failed to open")
-        self.stop_event.clear()
+        # Listen for global hotkeys
+        self._register_hotkeys()
 
         # Start mouse control thread
+        if self.pointer is None:
+            self.pointer = make_pointer_backend(
+                self.pointer_backend_name, (self.screen_w, self.screen_h)
+            )
         self.mouse_thread = threading.Thread(target=self.mouse_mover, daemon=True)
         self.mouse_thread.start()
 
         # Start processing
+        self._halting = False
+        self.running = True
         if block:
-            self.process_loop()
+            loop()
         else:
-            self.loop_thread = threading.Thread(target=self.process_loop, daemon=True)
+            self.loop_thread = threading.Thread(target=loop, daemon=True)
             self.loop_thread.start()
 
-    def stop(self):
-        """Stop tracking and cleanup"""
+    def prepare(self, open_source=False):
+        """Build the face model, and optionally open the frame source
+
+        Both are kept until stop(), so start() after prepare() or standby()
+        skips the cold start. In isolated mode the worker builds its own
+        model at start() and this does nothing.
+        """
+        self._wait_for_teardown()
+        if self.process_isolation:
+            return self
+        with self._prepare_lock:
+            if self.face_model is None:
+                self.face_model = FaceLandmarkModel(
+                    self.model_tier,
+                    min_detection_confidence=self.min_detection_confidence,
+                    min_tracking_confidence=self.min_tracking_confidence
+                )
+                # First inference initializes the graph's buffers
+                self.face_model.process(np.zeros((480, 640, 3), dtype=np.uint8), out=self._landmark_buf)
+            if open_source and not self.source.is_open:
+                self.camera_settings = self.source.open()
+                print(f"{self.source}: {self.camera_settings}")
+        return self
+
+    def prepare_async(self, open_source=False):
+        """Run prepare() on a background thread
+
+        Returns a concurrent.futures.Future resolving to the tracker, or to
+        the exception raised while preparing.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def run():
+            try:
+                future.set_result(self.prepare(open_source))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    @property
+    def ready(self):
+        """True when start() will not need to build the face model"""
+        return self.process_isolation or self.face_model is not None
+
+    def _start_worker(self, timeout=15.0):
+        """Launch the capture/inference process and attach to its frame ring"""
+        import multiprocessing as mproc
+        from TrackingWorker import SharedFrameRing, inference_worker
+
+        ctx = mproc.get_context("spawn")
+        config = {
+            "source": self.source,
+            "model_tier": self.model_tier,
+            "min_detection_confidence": self.min_detection_confidence,
+            "min_tracking_confidence": self.min_tracking_confidence,
+            "inference_width": self.front_end.target_width,
+            "roi_crop": self.front_end.roi_crop,
+            "adaptive_resolution": self.front_end.adaptive,
+            "scheduler": {
+                "enabled": self.scheduler.enabled,
+                "idle_after": self.scheduler.idle_after,
+                "motion_threshold": self.scheduler.motion_threshold,
+                "idle_rate": self.scheduler.idle_rate,
+                "absent_rate": self.scheduler.absent_rate,
+            },
+            "ring_slots": self.ring_slots,
+        }
+        self.worker_conn, child_conn = ctx.Pipe(duplex=False)
+        self.worker_stop = ctx.Event()
+        self.worker = ctx.Process(
+            target=inference_worker, args=(config, child_conn, self.worker_stop), daemon=True
+        )
+        self.worker.start()
+        child_conn.close()
+
+        # Worker reports the ring once the camera is open
+        try:
+            if not self.worker_conn.poll(timeout):
+                self._stop_worker()
+                raise RuntimeError("Tracking worker did not start")
+            msg = self.worker_conn.recv()
+        except (EOFError, OSError):
+            # Worker died without reporting an error
+            self._stop_worker()
+            raise RuntimeError("Tracking worker exited during startup")
+        if msg[0] != "ready":
+            self._stop_worker()
+            raise RuntimeError(msg[1] if msg[0] == "error" else f"Unexpected worker message {msg[0]!r}")
+        _, ring_name, shape, slots, self.camera_settings = msg
+        print(f"{self.source}: {self.camera_settings}")
+        self.frame_ring = SharedFrameRing(shape, slots=slots, name=ring_name)
+        self._key_indices = np.arange(len(self.KEY_ORDER))
+
+    def _stop_worker(self):
+        """Stop the worker process and detach from its frame ring"""
+        if self.worker_stop is not None:
+            self.worker_stop.set()
+        if self.worker is not None:
+            self.worker.join(timeout=2.0)
+            if self.worker.is_alive():
+                self.worker.terminate()
+                self.worker.join(timeout=1.0)
+            self.worker = None
+        if self.frame_ring is not None:
+            self.frame_ring.close()
+            self.frame_ring = None
+        if self.worker_conn is not None:
+            try:
+                self.worker_conn.close()
+            except Exception:
+                pass
+            self.worker_conn = None
+
+    def _halt(self):
+        """Stop the tracking threads, hotkeys, worker, recorder and windows"""
+        self._halting = True
+        self.running = False
         self.stop_event.set()
-        time.sleep(0.05)
+        self.frame_slot.close()
+        with self.mouse_cond:
+            self.mouse_cond.notify_all()
+
+        # Stop listening for hotkeys
+        self._unregister_hotkeys()
 
         # Stop threads (avoid joining current thread)
         current_thread = threading.current_thread()
@@ -199,31 +1320,140 @@ class HeadMouseTracker:
             self.mouse_thread != current_thread):
             self.mouse_thread.join(timeout=1.0)
 
-        # Cleanup camera
-        if self.cap:
+        if (self.capture_thread and self.capture_thread.is_alive() and
+            self.capture_thread != current_thread):
+            self.capture_thread.join(timeout=1.0)
+
+        # Stop worker process
+        self._stop_worker()
+
+        # Flush landmark recording; the next start() appends further chunks
+        if self.recorder is not None:
+            self.recorder.close()
+            print(f"Recorded {self.recorder.frames} frames to {self.record_path}")
+
+        # Cleanup windows
+        if self.visualizer is not None:
+            self.visualizer.stop()
+            self.visualizer = None
+
+    def standby(self, keep_source=False):
+        """Stop tracking but keep the face model, and optionally the source, warm
+
+        A later start() resumes without rebuilding the MediaPipe graph, and
+        without reopening the camera when ``keep_source`` is set. stop()
+        releases everything.
+        """
+        self._halt()
+        if not keep_source:
             try:
-                self.cap.release()
+                self.source.release()
             except Exception:
                 pass
-            self.cap = None
 
-        # Cleanup windows
+    def stop(self):
+        """Stop tracking and cleanup"""
+        self._halt()
+
+        # Release pointer backend we created
+        if self.pointer is not None and not isinstance(self.pointer_backend_name, PointerBackend):
+            self.pointer.close()
+            self.pointer = None
+
+        # Cleanup frame source
         try:
-            cv2.destroyAllWindows()
+            self.source.release()
         except Exception:
             pass
 
         # Cleanup MediaPipe
-        if self.face_mesh:
+        if self.face_model:
             try:
-                self.face_mesh.close()
+                self.face_model.close()
             except Exception:
                 pass
-            self.face_mesh = None
+            self.face_model = None
+
+    def stop_async(self, deadline=2.0):
+        """Stop tracking and release everything on a background thread
+
+        Returns immediately with a concurrent.futures.Future that resolves
+        to True once teardown finishes, or to False if it is still running
+        after ``deadline`` seconds. An overdue teardown keeps running, and the
+        next start() or prepare() waits for it to finish.
+        """
+        return self._teardown_async(self.stop, deadline)
+
+    def standby_async(self, keep_source=False, deadline=2.0):
+        """Non-blocking standby(); returns a Future like stop_async()"""
+        return self._teardown_async(lambda: self.standby(keep_source), deadline)
+
+    def _teardown_async(self, teardown, deadline):
+        """Run a teardown function in the background with a hard deadline"""
+        # Stop producing cursor moves right away
+        self.running = False
+        self._halting = True
+        self.stop_event.set()
+        self.frame_slot.close()
+        with self.mouse_cond:
+            self.mouse_cond.notify_all()
+
+        future = Future()
+        future.set_running_or_notify_cancel()
+        lock = threading.Lock()
+
+        def finish(done, error=None):
+            with lock:
+                if future.done():
+                    return
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(done)
+
+        previous = self._teardown_thread
+
+        def run():
+            try:
+                # Teardowns run one at a time, so joining the last covers all
+                if previous is not None:
+                    previous.join()
+                teardown()
+            except Exception as e:
+                finish(False, e)
+            else:
+                finish(True)
+
+        def expire():
+            if not future.done():
+                print(f"Tracker teardown still running after {deadline:.1f}s")
+            finish(False)
+
+        thread = threading.Thread(target=run, daemon=True)
+        self._teardown_thread = thread
+        thread.start()
+        timer = threading.Timer(deadline, expire)
+        timer.daemon = True
+        timer.start()
+        future.add_done_callback(lambda _: timer.cancel())
+        return future
+
+    def _wait_for_teardown(self):
+        """Block until a pending asynchronous teardown has really finished
+
+        Waits past the deadline: a teardown still running would otherwise
+        stop the threads, pointer, source and model of the new session.
+        """
+        thread = self._teardown_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._teardown_thread = None
 
     def toggle_mouse_control(self):
         """Toggle mouse control on/off"""
         self.mouse_enabled = not self.mouse_enabled
+        if self.mouse_enabled and self.pointer is not None:
+            self.pointer.forget()
         state = 'Enabled' if self.mouse_enabled else 'Disabled'
         print(f"Mouse Control: {state}")
 
@@ -251,203 +1481,475 @@ class HeadMouseTracker:
             self.euro_cutoff = cutoff
             self.euro_beta = beta
 
-            # Recreate filters
-            self.filter_x = OneEuroFilter(cutoff, beta, 1.0, freq)
-            self.filter_y = OneEuroFilter(cutoff, beta, 1.0, freq)
+            # Retune filter in place
+            self.pointer_filter.set_params(min_cutoff=cutoff, beta=beta, freq=freq)
             print(f"Filters updated: freq={freq}, cutoff={cutoff}, beta={beta}")
         else:
             print("Preserving custom filter parameters")
 
+        # Swap pose smoothing unless the caller chose one
+        if self.user_smoothing is None:
+            kind = "ema" if fast_mode else "window"
+            if kind != self.smoother.kind:
+                self.smoother = make_smoother(kind, window=self.filter_length, alpha=self.smoothing_alpha)
+            print(f"Pose smoothing: {kind} ({self.smoother.delay_frames:.1f} frames delay)")
+
     def calibrate_center(self):
         """Calibrate center position"""
         self.cal_yaw = 180.0 - self.raw_yaw
         self.cal_pitch = 180.0 - self.raw_pitch
         print(f"Calibrated - Yaw: {self.cal_yaw:.2f}, Pitch: {self.cal_pitch:.2f}")
 
+    def get_frame_stats(self):
+        """Return captured/dropped/stale frame counters"""
+        return self.frame_slot.stats()
+
+    @property
+    def inference_rate(self):
+        """Current measured face inference rate in Hz"""
+        if self.process_isolation:
+            return self.worker_stats.get("scheduler", {}).get("rate_hz", 0.0)
+        return self.scheduler.current_rate
+
+    def get_stats(self):
+        """Return a snapshot of tracker statistics
+
+        Cheap enough to call periodically while tracking runs.
+        """
+        pipeline = self.pipeline_stats.snapshot()
+        if self.process_isolation:
+            stats = dict(self.worker_stats)
+            worker_pipeline = stats.pop("pipeline", {"fps": 0.0, "latency": {}})
+            latency = dict(worker_pipeline["latency"])
+            latency.update((k, v) for k, v in pipeline["latency"].items() if v["count"])
+            stats["fps"] = pipeline["fps"]
+            stats["latency"] = latency
+            stats["camera"] = self.camera_settings
+            stats["smoothing"] = self.smoother.stats()
+            stats["pointer"] = self.pointer.stats() if self.pointer else {"backend": self.pointer_backend_name}
+            stats["prediction"] = self.predictor.stats() if self.predictor else None
+            stats["isolated"] = True
+            return stats
+        return {
+            "fps": pipeline["fps"],
+            "latency": pipeline["latency"],
+            "camera": self.camera_settings,
+            "frames": self.frame_slot.stats(),
+            "inference": self.front_end.stats(),
+            "model": self.face_model.stats() if self.face_model else {"tier": self.model_tier},
+            "smoothing": self.smoother.stats(),
+            "scheduler": self.scheduler.stats(),
+            "pointer": self.pointer.stats() if self.pointer else {"backend": self.pointer_backend_name},
+            "prediction": self.predictor.stats() if self.predictor else None,
+        }
+
+    def capture_loop(self):
+        """Capture thread; keeps only the newest frame from live sources
+
+        Offline sources played faster than real time hand over every frame.
+        """
+        lossless = not self.source.realtime
+        while not self.stop_event.is_set() and self.source.is_open:
+            start = time.perf_counter()
+            ret, frame = self.source.read()
+            if not ret:
+                break
+            self.pipeline_stats.record("capture", (time.perf_counter() - start) * 1000.0)
+            self.frame_slot.put(frame, self.source.timestamp, wait=lossless)
+        self.frame_slot.close()
+
+    def publish_target(self, x, y, timestamp=None):
+        """Set a new cursor target and wake the mouse thread
+
+        ``timestamp`` is the capture time of the frame the target came from.
+        """
+        with self.mouse_cond:
+            self.mouse_target[0] = x
+            self.mouse_target[1] = y
+            self.target_seq += 1
+            if self.predictor is not None:
+                self.predictor.update(
+                    (x, y), time.monotonic() if timestamp is None else timestamp,
+                    measure_latency=not self.replaying
+                )
+            self.mouse_cond.notify()
+        if timestamp is not None and self.source.realtime and not self.replaying:
+            self.pipeline_stats.record("end_to_end", (time.monotonic() - timestamp) * 1000.0)
+
+    def _inject(self, x, y):
+        """Move the cursor through the pointer backend, timing the call"""
+        start = time.perf_counter()
+        if self.pointer.move(x, y):
+            self.pipeline_stats.record("inject", (time.perf_counter() - start) * 1000.0)
+            for callback in self.cursor_listeners:
+                callback(*self.pointer.last)
+
+    def add_cursor_listener(self, callback):
+        """Call ``callback(x, y)`` from the mouse thread after each cursor move"""
+        if callback not in self.cursor_listeners:
+            self.cursor_listeners = self.cursor_listeners + [callback]
+
+    def remove_cursor_listener(self, callback):
+        """Stop notifying ``callback``"""
+        self.cursor_listeners = [c for c in self.cursor_listeners if c != callback]
+
+    def _wait_for_target(self, seen, timeout):
+        """Block until a target newer than ``seen`` arrives, or timeout/stop
+
+        Returns (seq, (x, y)).
+        """
+        with self.mouse_cond:
+            self.mouse_cond.wait_for(
+                lambda: self.stop_event.is_set() or self.target_seq != seen, timeout
+            )
+            return self.target_seq, tuple(self.mouse_target)
+
     def mouse_mover(self):
         """Mouse movement thread"""
+        if self.predictor is not None:
+            self.predictive_mouse_mover()
+            return
+        if self.mouse_interpolation:
+            self.interpolating_mouse_mover()
+            return
+
+        seen = -1
+        while not self.stop_event.is_set():
+            seq, (x, y) = self._wait_for_target(seen, timeout=None)
+            if seq == seen:
+                continue
+            seen = seq
+            if self.mouse_enabled:
+                self._inject(x, y)
+
+    def predictive_mouse_mover(self):
+        """Mouse thread that moves to the predicted target every mouse_sleep
+
+        Ticks only while recent targets exist to extrapolate from; otherwise
+        it sleeps until the next target arrives.
+        """
+        seen = -1
+        while not self.stop_event.is_set():
+            active = self.predictor.active(time.monotonic())
+            seen, _ = self._wait_for_target(seen, self.mouse_sleep if active else None)
+            if self.stop_event.is_set():
+                break
+
+            with self.mouse_cond:
+                pos = self.predictor.predict(time.monotonic())
+            if pos is None or not self.mouse_enabled:
+                continue
+            x = max(10, min(self.screen_w - 10, round(pos[0])))
+            y = max(10, min(self.screen_h - 10, round(pos[1])))
+            self._inject(x, y)
+
+    def interpolating_mouse_mover(self):
+        """Mouse thread that glides to each target at a fixed tick rate
+
+        Each new target is reached over one measured target interval.
+        Between targets the thread sleeps on the condition variable.
+        """
+        seen, target = self._wait_for_target(-1, timeout=0.0)
+        pos = start = end = np.array(target, dtype=np.float64)
+        arrived = time.monotonic()
+        interval = 1.0 / 30.0
+
         while not self.stop_event.is_set():
-            with self.mouse_lock:
-                x, y = self.mouse_target
+            settled = np.array_equal(pos, end)
+            seq, target = self._wait_for_target(seen, None if settled else self.mouse_sleep)
+            if self.stop_event.is_set():
+                break
+
+            now = time.monotonic()
+            if seq != seen:
+                seen = seq
+                interval += 0.2 * (min(max(now - arrived, 0.005), 0.2) - interval)
+                start, end = pos, np.array(target, dtype=np.float64)
+                arrived = now
+
+            frac = min(1.0, (now - arrived) / interval)
+            pos = end if frac >= 1.0 else start + (end - start) * frac
             if self.mouse_enabled:
-                pyautogui.moveTo(x, y)
-            time.sleep(self.mouse_sleep)
+                self._inject(round(pos[0]), round(pos[1]))
 
     @staticmethod
     def landmark_to_3d(landmark, w, h):
         """Convert MediaPipe landmark to 3D coordinates"""
         return np.array([landmark.x * w, landmark.y * h, landmark.z * w])
 
+    def update_from_landmarks(self, pts3d, timestamp=None):
+        """Run pose, smoothing and screen mapping on one frame of landmarks
+
+        Updates the mouse target and returns the pose used for drawing.
+        """
+        pose_start = time.perf_counter()
+
+        # Extract key facial points (left, right, top, bottom, front)
+        points = pts3d[self._key_indices].astype(np.float64)
+
+        # Calculate face coordinate system
+        center, right_vec, up_vec, forward_vec, w_half, h_half = face_frame(points)
+
+        # Smooth head orientation
+        smoothed = self.smoother.update(np.concatenate([center, forward_vec]), timestamp)
+        smooth_origin = smoothed[:3]
+        smooth_direction = smoothed[3:]
+        smooth_direction /= np.linalg.norm(smooth_direction)
+
+        # Calculate head angles
+        ref_forward = np.array([0, 0, -1])
+
+        # Yaw (left/right)
+        xz_proj = np.array([smooth_direction[0], 0, smooth_direction[2]])
+        xz_proj /= np.linalg.norm(xz_proj)
+        yaw_rad = math.acos(np.clip(np.dot(ref_forward, xz_proj), -1.0, 1.0))
+        if smooth_direction[0] < 0:
+            yaw_rad = -yaw_rad
+
+        # Pitch (up/down)
+        yz_proj = np.array([0, smooth_direction[1], smooth_direction[2]])
+        yz_proj /= np.linalg.norm(yz_proj)
+        pitch_rad = math.acos(np.clip(np.dot(ref_forward, yz_proj), -1.0, 1.0))
+        if smooth_direction[1] > 0:
+            pitch_rad = -pitch_rad
+
+        yaw_deg = np.degrees(yaw_rad)
+        pitch_deg = np.degrees(pitch_rad)
+
+        # Normalize angles
+        if yaw_deg < 0:
+            yaw_deg = abs(yaw_deg)
+        elif yaw_deg < 180:
+            yaw_deg = 360 - yaw_deg
+        if pitch_deg < 0:
+            pitch_deg = 360 + pitch_deg
+
+        # Store raw angles
+        self.raw_yaw = yaw_deg
+        self.raw_pitch = pitch_deg
+
+        # Apply calibration
+        yaw_deg += self.cal_yaw
+        pitch_deg += self.cal_pitch
+
+        # Map to screen coordinates
+        screen_x = int(((yaw_deg - (180 - self.yaw_range)) / (2 * self.yaw_range)) * self.screen_w)
+        screen_y = int(((180 + self.pitch_range - pitch_deg) / (2 * self.pitch_range)) * self.screen_h)
+
+        # Keep cursor on screen
+        screen_x = max(10, min(self.screen_w - 10, screen_x))
+        screen_y = max(10, min(self.screen_h - 10, screen_y))
+
+        # Apply smoothing filters
+        filter_start = time.perf_counter()
+        smooth_x, smooth_y = self.pointer_filter.filter((screen_x, screen_y), timestamp)
+        smooth_x = int(round(smooth_x))
+        smooth_y = int(round(smooth_y))
+        filter_end = time.perf_counter()
+        self.pipeline_stats.record("pose", (filter_start - pose_start) * 1000.0)
+        self.pipeline_stats.record("filter", (filter_end - filter_start) * 1000.0)
+
+        # Update mouse target
+        if self.mouse_enabled:
+            self.publish_target(smooth_x, smooth_y, timestamp)
+
+        return {
+            "points": points,
+            "center": center,
+            "axes": np.stack([right_vec, up_vec, forward_vec]),
+            "half_size": (w_half, h_half),
+            "smooth_origin": smooth_origin,
+            "smooth_direction": smooth_direction,
+            "yaw": yaw_deg,
+            "pitch": pitch_deg,
+            "target": (smooth_x, smooth_y),
+        }
+
+    def _register_hotkeys(self):
+        """Hook the global hotkeys; they run on the keyboard listener thread"""
+        if self._hotkey_handles or not self.hotkeys:
+            return
+        import keyboard
+        for combo, event in self.hotkeys.items():
+            try:
+                handle = keyboard.add_hotkey(combo, self.post_event, args=(event,))
+            except (ImportError, OSError, ValueError) as e:
+                # Linux needs root (or uinput access) for global hooks
+                print(f"Hotkey {combo} unavailable: {e}")
+                continue
+            self._hotkey_handles.append(handle)
+
+    def _unregister_hotkeys(self):
+        """Remove the hotkeys added by _register_hotkeys"""
+        if not self._hotkey_handles:
+            return
+        import keyboard
+        for handle in self._hotkey_handles:
+            try:
+                keyboard.remove_hotkey(handle)
+            except (KeyError, ValueError):
+                pass
+        self._hotkey_handles = []
+
+    def post_event(self, event):
+        """Apply a tracker event: "toggle", "calibrate" or "quit"
+
+        Safe to call from any thread. Repeats of the same event within
+        EVENT_DEBOUNCE seconds (key auto-repeat) are ignored.
+        """
+        now = time.monotonic()
+        if now - self._last_event.get(event, -math.inf) < self.EVENT_DEBOUNCE:
+            return
+        self._last_event[event] = now
+
+        if event == "toggle":
+            self.toggle_mouse_control()
+        elif event == "calibrate":
+            self.calibrate_center()
+        elif event == "quit":
+            self.stop_event.set()
+            self.frame_slot.close()
+            with self.mouse_cond:
+                self.mouse_cond.notify_all()
+        else:
+            raise ValueError(f"Unknown tracker event {event!r}")
+
+    def handle_key(self, key):
+        """Handle a key pressed in a debug window"""
+        event = self.WINDOW_KEYS.get(key)
+        if event is not None:
+            self.post_event(event)
+
+    def replay(self, recording, realtime=False):
+        """Feed a landmark recording through pose, smoothing and mapping
+
+        ``recording`` is a LandmarkRecording or its path. Capture and
+        MediaPipe are skipped; with ``realtime`` the recorded frame timing
+        is reproduced, otherwise frames run back to back. Targets reach the
+        cursor only if the mouse thread is running. Returns an (N, 2) array
+        of cursor targets, NaN for frames without a face.
+        """
+        if not isinstance(recording, LandmarkRecording):
+            recording = LandmarkRecording(recording)
+
+        key_indices = self._key_indices
+        self._key_indices = recording.key_indices
+        self.smoother.reset()
+        self.pointer_filter.reset()
+        if self.predictor is not None:
+            self.predictor.reset()
+
+        targets = []
+        first = start = None
+        self.replaying = True
+        try:
+            for timestamp, pts in recording:
+                if realtime:
+                    if first is None:
+                        first, start = timestamp, time.monotonic()
+                    time.sleep(max(0.0, start + (timestamp - first) - time.monotonic()))
+                if pts is None:
+                    targets.append((np.nan, np.nan))
+                    continue
+                pose = self.update_from_landmarks(pts, timestamp)
+                targets.append(pose["target"])
+                self.pipeline_stats.fps.tick()
+        finally:
+            self._key_indices = key_indices
+            self.replaying = False
+        return np.array(targets, dtype=np.float64).reshape(-1, 2)
+
     def process_loop(self):
         """Main processing loop"""
-        while not self.stop_event.is_set() and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if not ret:
+        while not self.stop_event.is_set():
+            # Back off while idle, then take the freshest frame
+            delay = self.scheduler.next_delay(time.monotonic())
+            if delay > 0:
+                self.stop_event.wait(delay)
+                continue
+
+            frame, frame_time = self.frame_slot.get(timeout=0.5)
+            if frame is None:
+                if self.frame_slot.closed:
+                    break
+                continue
+
+            frame_start = time.perf_counter()
+            rgb = self.front_end.prepare(frame)
+            infer_start = time.perf_counter()
+            pts3d = self.face_model.process(rgb, out=self._landmark_buf)
+            infer_ms = (time.perf_counter() - infer_start) * 1000.0
+            self.pipeline_stats.record("preprocess", (infer_start - frame_start) * 1000.0)
+            self.pipeline_stats.record("inference", infer_ms)
+
+            pose = None
+            if pts3d is not None:
+                self.front_end.to_frame(pts3d)
+                pose = self.update_from_landmarks(pts3d, frame_time)
+            if self.recorder is not None:
+                self.recorder.record(frame_time, pts3d)
+            self.front_end.update(pts3d, frame.shape, infer_ms)
+            self.scheduler.record(pose["points"] if pose else None, time.monotonic())
+            self.pipeline_stats.record("frame", (time.perf_counter() - frame_start) * 1000.0)
+            self.pipeline_stats.fps.tick()
+
+            # Hand off to the debug visualizer without waiting on it
+            if self.visualizer is not None:
+                full = pts3d is not None and self.render_mode == self.RENDER_FULL
+                self.visualizer.submit(frame, pts3d.copy() if full else None, pose)
+
+        # Cleanup on exit, unless standby() or stop() ended the loop
+        self.running = False
+        if not self._halting:
+            self.stop()
+
+    def result_loop(self):
+        """Apply worker results when inference runs in a separate process"""
+        while not self.stop_event.is_set():
+            conn = self.worker_conn
+            try:
+                ready = conn is not None and conn.poll(0.5)
+            except (EOFError, OSError):
                 break
+            if not ready:
+                if self.worker is None or not self.worker.is_alive():
+                    break
+                continue
 
-            h, w, _ = frame.shape
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.face_mesh.process(rgb)
-
-            if results.multi_face_landmarks:
-                landmarks = results.multi_face_landmarks[0].landmark
-                debug_frame = np.zeros_like(frame)
-
-                # Draw landmarks for debugging
-                for i, landmark in enumerate(landmarks):
-                    pt = self.landmark_to_3d(landmark, w, h)
-                    x, y = int(pt[0]), int(pt[1])
-                    if 0 <= x < w and 0 <= y < h:
-                        color = (155, 155, 155) if i in self.FACE_OUTLINE else (255, 25, 10)
-                        cv2.circle(debug_frame, (x, y), 3, color, -1)
-                        frame[y, x] = (255, 255, 255)
-
-                # Extract key facial points
-                points = {}
-                for name, idx in self.LANDMARKS.items():
-                    pt = self.landmark_to_3d(landmarks[idx], w, h)
-                    points[name] = pt
-                    x, y = int(pt[0]), int(pt[1])
-                    cv2.circle(frame, (x, y), 4, (0, 0, 0), -1)
-
-                # Get face orientation points
-                left = points["left"]
-                right = points["right"]
-                top = points["top"]
-                bottom = points["bottom"]
-                front = points["front"]
-
-                # Calculate face coordinate system
-                right_vec = (right - left)
-                right_vec /= np.linalg.norm(right_vec)
-
-                up_vec = (top - bottom)
-                up_vec /= np.linalg.norm(up_vec)
-
-                forward_vec = np.cross(right_vec, up_vec)
-                forward_vec /= np.linalg.norm(forward_vec)
-                forward_vec = -forward_vec  # Point outward
-
-                # Face center
-                center = (left + right + top + bottom + front) / 5.0
-
-                # Draw 3D cube for visualization
-                w_half = np.linalg.norm(right - left) / 2.0
-                h_half = np.linalg.norm(top - bottom) / 2.0
-                d_half = 80.0
-
-                def corner(x, y, z):
-                    return (center + x * w_half * right_vec +
-                            y * h_half * up_vec + z * d_half * forward_vec)
-
-                # Cube corners
-                corners = [
-                    corner(-1, 1, -1), corner(1, 1, -1),
-                    corner(1, -1, -1), corner(-1, -1, -1),
-                    corner(-1, 1, 1), corner(1, 1, 1),
-                    corner(1, -1, 1), corner(-1, -1, 1),
-                ]
-
-                # Draw cube edges
-                edges = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4), (0, 4), (1, 5), (2, 6), (3, 7)]
-                corners_2d = [(int(p[0]), int(p[1])) for p in corners]
-                for i, j in edges:
-                    cv2.line(frame, corners_2d[i], corners_2d[j], (255, 125, 35), 2)
-
-                # Smooth head orientation
-                self.origins.append(center)
-                self.directions.append(forward_vec)
-                smooth_origin = np.mean(self.origins, axis=0)
-                smooth_direction = np.mean(self.directions, axis=0)
-                smooth_direction /= np.linalg.norm(smooth_direction)
-
-                # Calculate head angles
-                ref_forward = np.array([0, 0, -1])
-
-                # Yaw (left/right)
-                xz_proj = np.array([smooth_direction[0], 0, smooth_direction[2]])
-                xz_proj /= np.linalg.norm(xz_proj)
-                yaw_rad = math.acos(np.clip(np.dot(ref_forward, xz_proj), -1.0, 1.0))
-                if smooth_direction[0] < 0:
-                    yaw_rad = -yaw_rad
-
-                # Pitch (up/down)
-                yz_proj = np.array([0, smooth_direction[1], smooth_direction[2]])
-                yz_proj /= np.linalg.norm(yz_proj)
-                pitch_rad = math.acos(np.clip(np.dot(ref_forward, yz_proj), -1.0, 1.0))
-                if smooth_direction[1] > 0:
-                    pitch_rad = -pitch_rad
-
-                yaw_deg = np.degrees(yaw_rad)
-                pitch_deg = np.degrees(pitch_rad)
-
-                # Normalize angles
-                if yaw_deg < 0:
-                    yaw_deg = abs(yaw_deg)
-                elif yaw_deg < 180:
-                    yaw_deg = 360 - yaw_deg
-                if pitch_deg < 0:
-                    pitch_deg = 360 + pitch_deg
-
-                # Store raw angles
-                self.raw_yaw = yaw_deg
-                self.raw_pitch = pitch_deg
-
-                # Apply calibration
-                yaw_deg += self.cal_yaw
-                pitch_deg += self.cal_pitch
-
-                # Map to screen coordinates
-                screen_x = int(((yaw_deg - (180 - self.yaw_range)) / (2 * self.yaw_range)) * self.screen_w)
-                screen_y = int(((180 + self.pitch_range - pitch_deg) / (2 * self.pitch_range)) * self.screen_h)
-
-                # Keep cursor on screen
-                screen_x = max(10, min(self.screen_w - 10, screen_x))
-                screen_y = max(10, min(self.screen_h - 10, screen_y))
-
-                # Apply smoothing filters
-                smooth_x = int(round(self.filter_x.filter(screen_x)))
-                smooth_y = int(round(self.filter_y.filter(screen_y)))
-
-                # Update mouse target
-                if self.mouse_enabled:
-                    with self.mouse_lock:
-                        self.mouse_target[0] = smooth_x
-                        self.mouse_target[1] = smooth_y
-
-                # Draw head direction ray
-                ray_length = 2.5 * d_half
-                ray_end = smooth_origin - smooth_direction * ray_length
-                start_2d = (int(smooth_origin[0]), int(smooth_origin[1]))
-                end_2d = (int(ray_end[0]), int(ray_end[1]))
-                cv2.line(frame, start_2d, end_2d, (15, 255, 0), 3)
-                cv2.line(debug_frame, start_2d, end_2d, (15, 255, 0), 3)
-
-                # Show windows (already created and placed)
-                cv2.imshow("Head Tracking", frame)
-                cv2.imshow("Landmarks", debug_frame)
-
-                # Hotkey for toggling mouse control
-                if keyboard.is_pressed('f7'):
-                    self.toggle_mouse_control()
-                    time.sleep(0.3)
-
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    self.stop()
-                    return
-                elif key == ord('c'):
-                    self.calibrate_center()
-
-            else:
-                # No face detected - show frame anyway
-                cv2.imshow("Head Tracking", frame)
-                if cv2.waitKey(1) & 0xFF == ord('q'):
-                    self.stop()
-                    return
-
-        # Cleanup on exit
-        self.stop()
+            # Drain the pipe and keep only the newest result
+            result = None
+            try:
+                while conn.poll():
+                    msg = conn.recv()
+                    if msg[0] == "result":
+                        result = msg
+                    elif msg[0] == "stats":
+                        self.worker_stats = msg[1]
+                    elif msg[0] == "error":
+                        print(f"Tracking worker error: {msg[1]}")
+            except (EOFError, OSError):
+                break
+            if result is None:
+                continue
+
+            _, seq, frame_time, points, _ = result
+            self.pipeline_stats.fps.tick()
+            if self.recorder is not None:
+                self.recorder.record(frame_time, points)
+            pose = None
+            if points is not None:
+                pose = self.update_from_landmarks(points, frame_time)
+
+            # Debug view reads the frame straight from shared memory
+            if self.visualizer is not None and self.frame_ring is not None:
+                frame = self.frame_ring.read(seq)
+                if frame is not None:
+                    self.visualizer.submit(frame, None, pose)
+
+        # Cleanup on exit, unless standby() or stop() ended the loop
+        self.running = False
+        if not self._halting:
+            self.stop()
 
 
 def main():
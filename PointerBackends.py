@@ -0,0 +1,198 @@
+"""Pointer injection backends for head tracking
+
+Each backend moves the system cursor to absolute screen coordinates. The
+shared base class skips moves to the position it already set and keeps a
+window of per-call injection latencies.
+
+Backends:
+    pyautogui - portable; bypasses pyautogui's per-call PAUSE sleep
+    xtest     - X11 XTest extension via python-xlib
+    uinput    - Linux kernel uinput absolute pointer via python-evdev
+    fake      - in-memory recorder for tests and benchmarks
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+
+class PointerBackend:
+    """Base class: change detection and latency bookkeeping"""
+
+    name = "base"
+
+    def __init__(self, history=256):
+        self.last = None
+        self.moves = 0
+        self.skipped = 0
+        self._latency = np.zeros(history)
+        self._latency_index = 0
+
+    def move(self, x, y):
+        """Move the cursor to (x, y) if it is not already there
+
+        Returns True when an event was injected.
+        """
+        pos = (int(x), int(y))
+        if pos == self.last:
+            self.skipped += 1
+            return False
+
+        start = time.perf_counter()
+        self._move(*pos)
+        elapsed = (time.perf_counter() - start) * 1000.0
+
+        self._latency[self._latency_index % len(self._latency)] = elapsed
+        self._latency_index += 1
+        self.last = pos
+        self.moves += 1
+        return True
+
+    def _move(self, x, y):
+        raise NotImplementedError
+
+    def forget(self):
+        """Drop the remembered position so the next move always injects"""
+        self.last = None
+
+    def close(self):
+        """Release backend resources"""
+
+    def stats(self):
+        """Return injection counts and latency percentiles in ms"""
+        n = min(self._latency_index, len(self._latency))
+        window = self._latency[:n]
+        return {
+            "backend": self.name,
+            "moves": self.moves,
+            "skipped": self.skipped,
+            "latency_p50_ms": float(np.percentile(window, 50)) if n else 0.0,
+            "latency_p99_ms": float(np.percentile(window, 99)) if n else 0.0,
+        }
+
+
+class PyAutoGuiBackend(PointerBackend):
+    """pyautogui.moveTo without the default PAUSE sleep after each call"""
+
+    name = "pyautogui"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def _move(self, x, y):
+        self._pyautogui.moveTo(x, y, _pause=False)
+
+
+class XTestBackend(PointerBackend):
+    """Absolute motion events through the X11 XTest extension"""
+
+    name = "xtest"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        try:
+            from Xlib import X, display
+            from Xlib.ext import xtest
+        except ImportError:
+            raise RuntimeError("XTest backend needs python-xlib: pip install python-xlib")
+        self._display = display.Display()
+        if not self._display.has_extension("XTEST"):
+            self._display.close()
+            raise RuntimeError("X server does not support the XTEST extension")
+        self._motion = X.MotionNotify
+        self._xtest = xtest
+
+    def _move(self, x, y):
+        self._xtest.fake_input(self._display, self._motion, x=x, y=y)
+        self._display.flush()
+
+    def close(self):
+        try:
+            self._display.close()
+        except Exception:
+            pass
+
+
+class UInputBackend(PointerBackend):
+    """Virtual absolute pointer device through Linux uinput
+
+    Needs write access to /dev/uinput.
+    """
+
+    name = "uinput"
+
+    def __init__(self, screen_size, **kwargs):
+        super().__init__(**kwargs)
+        try:
+            from evdev import AbsInfo, UInput, ecodes
+        except ImportError:
+            raise RuntimeError("uinput backend needs python-evdev: pip install evdev")
+        w, h = screen_size
+        capabilities = {
+            ecodes.EV_KEY: [ecodes.BTN_LEFT, ecodes.BTN_RIGHT, ecodes.BTN_MIDDLE],
+            ecodes.EV_ABS: [
+                (ecodes.ABS_X, AbsInfo(value=0, min=0, max=w - 1, fuzz=0, flat=0, resolution=0)),
+                (ecodes.ABS_Y, AbsInfo(value=0, min=0, max=h - 1, fuzz=0, flat=0, resolution=0)),
+            ],
+        }
+        try:
+            self._device = UInput(capabilities, name="halo-head-pointer")
+        except (OSError, PermissionError) as e:
+            raise RuntimeError(f"Could not open /dev/uinput: {e}")
+        self._ecodes = ecodes
+
+    def _move(self, x, y):
+        e = self._ecodes
+        self._device.write(e.EV_ABS, e.ABS_X, x)
+        self._device.write(e.EV_ABS, e.ABS_Y, y)
+        self._device.syn()
+
+    def close(self):
+        try:
+            self._device.close()
+        except Exception:
+            pass
+
+
+class FakePointerBackend(PointerBackend):
+    """Records injected positions in memory"""
+
+    name = "fake"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.positions = []
+
+    def _move(self, x, y):
+        self.positions.append((x, y, time.monotonic()))
+
+
+BACKENDS = ("auto", "pyautogui", "xtest", "uinput", "fake")
+
+
+def make_pointer_backend(name="pyautogui", screen_size=None):
+    """Create a backend by name
+
+    "auto" tries XTest on an X11 session and falls back to pyautogui.
+    """
+    if name == "auto":
+        if sys.platform.startswith("linux") and os.environ.get("DISPLAY"):
+            try:
+                return XTestBackend()
+            except RuntimeError as e:
+                print(f"XTest unavailable ({e}), using pyautogui")
+        return PyAutoGuiBackend()
+    if name == "pyautogui":
+        return PyAutoGuiBackend()
+    if name == "xtest":
+        return XTestBackend()
+    if name == "uinput":
+        if screen_size is None:
+            raise ValueError("uinput backend needs screen_size")
+        return UInputBackend(screen_size)
+    if name == "fake":
+        return FakePointerBackend()
+    raise ValueError(f"pointer backend must be one of {BACKENDS}, got {name!r}")
@@ -0,0 +1,120 @@
+"""Low-overhead latency histograms and frame rate counters for tracking
+
+Histograms use fixed log-spaced bins, so recording a sample is a few
+arithmetic operations and memory never grows. Percentiles are read from
+the bin counts and are accurate to the bin width (about 5%).
+"""
+import math
+import time
+
+
+class LatencyHistogram:
+    """Fixed-size histogram of durations in milliseconds"""
+
+    def __init__(self, min_ms=0.01, max_ms=10000.0, bins=300):
+        self.min_ms = float(min_ms)
+        self.bins = int(bins)
+        self._log_min = math.log(self.min_ms)
+        self._log_step = (math.log(max_ms) - self._log_min) / self.bins
+        self.counts = [0] * self.bins
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, ms):
+        """Add one sample"""
+        if ms <= self.min_ms:
+            i = 0
+        else:
+            i = min(self.bins - 1, int((math.log(ms) - self._log_min) / self._log_step))
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, q):
+        """Upper edge of the bin holding the q-th percentile (0-100)"""
+        if self.count == 0:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return min(self.max, math.exp(self._log_min + (i + 1) * self._log_step))
+        return self.max
+
+    def reset(self):
+        """Clear all samples"""
+        self.counts = [0] * self.bins
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def summary(self):
+        """Return count, mean and p50/p95/p99 in ms"""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class FpsCounter:
+    """Events per second over roughly one-second windows"""
+
+    def __init__(self, window=1.0):
+        self.window = float(window)
+        self.fps = 0.0
+        self._count = 0
+        self._start = None
+
+    def tick(self, now=None):
+        """Count one event"""
+        now = time.monotonic() if now is None else now
+        if self._start is None:
+            self._start = now
+        self._count += 1
+        elapsed = now - self._start
+        if elapsed >= self.window:
+            self.fps = self._count / elapsed
+            self._count = 0
+            self._start = now
+
+    def reset(self):
+        """Clear the counter"""
+        self.fps = 0.0
+        self._count = 0
+        self._start = None
+
+
+class PipelineStats:
+    """Per-stage latency histograms plus a processed-frame rate"""
+
+    def __init__(self, stages=()):
+        self.histograms = {name: LatencyHistogram() for name in stages}
+        self.fps = FpsCounter()
+
+    def record(self, stage, ms):
+        """Add a duration sample for a stage"""
+        hist = self.histograms.get(stage)
+        if hist is None:
+            hist = self.histograms[stage] = LatencyHistogram()
+        hist.record(ms)
+
+    def reset(self):
+        """Clear all histograms and the frame counter"""
+        for hist in self.histograms.values():
+            hist.reset()
+        self.fps.reset()
+
+    def snapshot(self):
+        """Return per-stage summaries and the current frame rate"""
+        return {
+            "fps": self.fps.fps,
+            "latency": {name: hist.summary() for name, hist in self.histograms.items()},
+        }
@@ -0,0 +1,200 @@
+"""Process-isolated camera capture and face inference for HeadMouseTracker
+
+The worker process owns the camera and the MediaPipe graph. Frames are
+published through a shared-memory ring so the GUI process can show them
+without pickling, and only compact per-frame results (timestamp, the five
+pose key points, inference time) travel back over a pipe.
+"""
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from MonitorTracking import (
+    FaceLandmarkModel, InferenceFrontEnd, InferenceScheduler, LatestFrameSlot
+)
+from TrackingStats import PipelineStats
+
+
+class SharedFrameRing:
+    """Fixed number of frame slots in one shared memory block
+
+    Each slot carries a sequence number that the writer clears before
+    copying a frame in and sets afterwards. A reader copies a slot and then
+    re-checks the number, so a frame overwritten mid-copy is rejected.
+    """
+
+    def __init__(self, shape, slots=4, dtype=np.uint8, name=None, create=False):
+        self.shape = tuple(shape)
+        self.slots = int(slots)
+        self.dtype = np.dtype(dtype)
+        self.owner = create
+
+        header = 8 * self.slots
+        frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=create, size=header + self.slots * frame_bytes
+        )
+        self.seqs = np.ndarray((self.slots,), dtype=np.int64, buffer=self.shm.buf)
+        self.frames = np.ndarray(
+            (self.slots,) + self.shape, dtype=self.dtype, buffer=self.shm.buf, offset=header
+        )
+        if create:
+            self.seqs[:] = -1
+        else:
+            # Only the creating process may unlink the block
+            try:
+                resource_tracker.unregister(self.shm._name, "shared_memory")
+            except Exception:
+                pass
+        self._next_seq = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def write(self, frame):
+        """Copy a frame into the next slot and return its sequence number"""
+        seq = self._next_seq
+        self._next_seq += 1
+        i = seq % self.slots
+        self.seqs[i] = -1
+        self.frames[i] = frame
+        self.seqs[i] = seq
+        return seq
+
+    def read(self, seq, out=None):
+        """Copy out frame ``seq``, or return None if it has been overwritten"""
+        i = seq % self.slots
+        if self.seqs[i] != seq:
+            return None
+        if out is None:
+            out = np.empty(self.shape, dtype=self.dtype)
+        np.copyto(out, self.frames[i])
+        if self.seqs[i] != seq:
+            return None
+        return out
+
+    def close(self):
+        """Unmap the block, and remove it if this side created it"""
+        self.seqs = None
+        self.frames = None
+        try:
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+
+def inference_worker(config, conn, stop_event):
+    """Worker process entry point
+
+    Messages sent on ``conn``:
+        ("ready", ring_name, frame_shape, ring_slots, camera_settings)
+        ("result", seq, frame_time, points or None, infer_ms)
+        ("stats", dict)
+        ("error", message)
+    """
+    source = config["source"]
+    try:
+        camera_settings = source.open()
+    except (RuntimeError, ValueError) as e:
+        conn.send(("error", str(e)))
+        return
+    ret, first = source.read()
+    if not ret:
+        conn.send(("error", f"{source} returned no frames"))
+        source.release()
+        return
+
+    try:
+        model = FaceLandmarkModel(
+            config["model_tier"],
+            min_detection_confidence=config["min_detection_confidence"],
+            min_tracking_confidence=config["min_tracking_confidence"]
+        )
+    except Exception as e:
+        conn.send(("error", f"Face model failed to load: {e}"))
+        source.release()
+        return
+    front_end = InferenceFrontEnd(
+        target_width=config["inference_width"],
+        roi_crop=config["roi_crop"],
+        adaptive=config["adaptive_resolution"]
+    )
+    scheduler = InferenceScheduler(**config["scheduler"])
+    ring = SharedFrameRing(first.shape, slots=config["ring_slots"], create=True)
+    slot = LatestFrameSlot()
+    pipeline = PipelineStats(("capture", "preprocess", "inference"))
+    buf = np.empty((model.num_landmarks, 3), dtype=np.float32)
+
+    def capture():
+        lossless = not source.realtime
+        while not stop_event.is_set():
+            start = time.perf_counter()
+            ret, frame = source.read()
+            if not ret:
+                break
+            pipeline.record("capture", (time.perf_counter() - start) * 1000.0)
+            slot.put(frame, source.timestamp, wait=lossless)
+        slot.close()
+
+    capture_thread = threading.Thread(target=capture, daemon=True)
+    capture_thread.start()
+    conn.send(("ready", ring.name, first.shape, ring.slots, camera_settings))
+
+    next_stats = time.monotonic() + 1.0
+    try:
+        while not stop_event.is_set():
+            delay = scheduler.next_delay(time.monotonic())
+            if delay > 0:
+                stop_event.wait(delay)
+                continue
+
+            frame, frame_time = slot.get(timeout=0.5)
+            if frame is None:
+                if slot.closed:
+                    break
+                continue
+            if frame.shape != ring.shape:
+                continue
+            seq = ring.write(frame)
+
+            prep_start = time.perf_counter()
+            rgb = front_end.prepare(frame)
+            infer_start = time.perf_counter()
+            pts3d = model.process(rgb, out=buf)
+            infer_ms = (time.perf_counter() - infer_start) * 1000.0
+            pipeline.record("preprocess", (infer_start - prep_start) * 1000.0)
+            pipeline.record("inference", infer_ms)
+            pipeline.fps.tick()
+
+            points = None
+            if pts3d is not None:
+                front_end.to_frame(pts3d)
+                points = pts3d[model.key_indices].astype(np.float32)
+            front_end.update(pts3d, frame.shape, infer_ms)
+            scheduler.record(points, time.monotonic())
+            conn.send(("result", seq, frame_time, points, infer_ms))
+
+            now = time.monotonic()
+            if now >= next_stats:
+                next_stats = now + 1.0
+                conn.send(("stats", {
+                    "frames": slot.stats(),
+                    "inference": front_end.stats(),
+                    "model": model.stats(),
+                    "scheduler": scheduler.stats(),
+                    "pipeline": pipeline.snapshot(),
+                }))
+    except (BrokenPipeError, EOFError):
+        pass
+    finally:
+        stop_event.set()
+        slot.close()
+        capture_thread.join(timeout=1.0)
+        source.release()
+        model.close()
+        ring.close()
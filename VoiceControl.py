@@ -11,11 +11,14 @@ Usage:
 """
 
 import argparse
+import json
 import os
 import queue
 import sys
 import threading
-from typing import Optional, Callable
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Callable, Union
 
 import sounddevice as sd
 from vosk import Model, KaldiRecognizer
@@ -28,14 +31,87 @@ def int_or_str(text):
         return text
 
 
+def load_model(model: str) -> Model:
+    """Load a Vosk model from a directory path or a language code."""
+    if os.path.isdir(model):
+        return Model(model)
+    # treat as language code (e.g. "en-us", "th")
+    return Model(lang=model)
+
+
+class ModelCache:
+    """
+    Process-wide cache of loaded Vosk models, keyed by path or language code.
+
+    Each model is loaded once, on the first get() or preload(); concurrent
+    requests for a model that is still loading wait for the same load.
+    With max_models set, the least recently used model is dropped when a
+    new one is loaded (recognizers already using it keep their reference).
+    """
+
+    def __init__(self, max_models: Optional[int] = None):
+        self.max_models = max_models
+        self._models = OrderedDict()  # key -> Future[Model]
+        self._lock = threading.Lock()
+
+    def preload(self, model: str) -> Future:
+        """Start loading a model on a background thread; returns a Future."""
+        with self._lock:
+            future = self._models.get(model)
+            if future is not None:
+                self._models.move_to_end(model)
+                return future
+            future = Future()
+            future.set_running_or_notify_cancel()
+            self._models[model] = future
+            self._evict()
+
+        def load():
+            try:
+                future.set_result(load_model(model))
+            except Exception as e:
+                with self._lock:
+                    if self._models.get(model) is future:
+                        del self._models[model]
+                future.set_exception(e)
+
+        threading.Thread(target=load, daemon=True).start()
+        return future
+
+    def get(self, model: str, timeout: Optional[float] = None) -> Model:
+        """Return a loaded model, loading it (or waiting for a preload) if needed."""
+        return self.preload(model).result(timeout)
+
+    def is_loaded(self, model: str) -> bool:
+        with self._lock:
+            future = self._models.get(model)
+        return future is not None and future.done() and future.exception() is None
+
+    def evict(self, model: str):
+        """Drop a model from the cache."""
+        with self._lock:
+            self._models.pop(model, None)
+
+    def _evict(self):
+        if self.max_models is None:
+            return
+        while len(self._models) > self.max_models:
+            self._models.popitem(last=False)
+
+
+# Shared by every recognizer in the process
+MODEL_CACHE = ModelCache()
+
+
 class VoskMicRecognizer:
     """
     Simple wrapper around sounddevice + Vosk.
 
     Parameters
     ----------
-    model : str
-        Either a path to an unzipped Vosk model directory, or a language code for Model(lang=...).
+    model : str | Model
+        A path to an unzipped Vosk model directory, a language code for Model(lang=...),
+        or an already loaded Model. Paths and codes are loaded through the model cache.
     device : int | str | None
         Input device index or substring (sounddevice syntax).
     samplerate : int | None
@@ -48,19 +124,27 @@ class VoskMicRecognizer:
         Callback for partial results (JSON string from Vosk).
     on_result : Callable[[str], None] | None
         Callback for final results (JSON string from Vosk).
+    cache : ModelCache
+        Where models are loaded and kept between recognizers (default: MODEL_CACHE).
+    grammar : list[str] | None
+        Phrases to restrict decoding to; anything else comes out as "[unk]".
+        None decodes free-form. Needs a model with a dynamic graph (the small models).
     """
 
     def __init__(
         self,
-        model: str,
+        model: Union[str, Model],
         device=None,
         samplerate: Optional[int] = None,
         blocksize: int = 8000,
         filename: Optional[str] = None,
         on_partial: Optional[Callable[[str], None]] = None,
         on_result: Optional[Callable[[str], None]] = None,
+        cache: Optional[ModelCache] = None,
+        grammar: Optional[list] = None,
     ):
         self.model_arg = model
+        self.cache = cache or MODEL_CACHE
         self.device = device
         self.blocksize = blocksize
         self.user_samplerate = samplerate
@@ -69,6 +153,10 @@ class VoskMicRecognizer:
         self.on_partial = on_partial
         self.on_result = on_result
 
+        self.grammar = list(grammar) if grammar else None
+        self._grammar_changed = False
+        self._grammar_lock = threading.Lock()
+
         self._queue = queue.Queue()
         self._stream = None
         self._rec = None
@@ -89,15 +177,16 @@ class VoskMicRecognizer:
         else:
             self._samplerate = int(self.user_samplerate)
 
-        # model
-        if os.path.isdir(self.model_arg):
-            self._model = Model(self.model_arg)
+        # model (shared, loaded once per process)
+        if isinstance(self.model_arg, Model):
+            self._model = self.model_arg
         else:
-            # treat as language code (e.g. "en-us", "th")
-            self._model = Model(lang=self.model_arg)
+            self._model = self.cache.get(self.model_arg)
 
         # recognizer
-        self._rec = KaldiRecognizer(self._model, self._samplerate)
+        with self._grammar_lock:
+            self._rec = self._make_recognizer()
+            self._grammar_changed = False
 
         # optional dump file (raw PCM16, same as your original)
         if self.filename:
@@ -156,8 +245,22 @@ class VoskMicRecognizer:
         # self._rec = None
         # self._model = None
 
+    def set_grammar(self, grammar: Optional[list]):
+        """Switch between grammar-constrained (phrase list) and free-form (None) decoding.
+
+        Safe to call from any thread; applies from the next audio block.
+        """
+        with self._grammar_lock:
+            self.grammar = list(grammar) if grammar else None
+            self._grammar_changed = True
+
     # ---------- internals ----------
 
+    def _make_recognizer(self):
+        if self.grammar:
+            return KaldiRecognizer(self._model, self._samplerate, json.dumps(self.grammar + ["[unk]"]))
+        return KaldiRecognizer(self._model, self._samplerate)
+
     def _callback(self, indata, frames, time, status):
         if status:
             print(status, file=sys.stderr)
@@ -175,6 +278,11 @@ class VoskMicRecognizer:
                 except queue.Empty:
                     continue
 
+                if self._grammar_changed:
+                    with self._grammar_lock:
+                        self._rec = self._make_recognizer()
+                        self._grammar_changed = False
+
                 if self._rec.AcceptWaveform(data):
                     res = self._rec.Result()
                     if self.on_result:
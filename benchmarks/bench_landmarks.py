@@ -0,0 +1,104 @@
+"""Micro-benchmark for per-frame landmark extraction
+
+Compares the old per-landmark Python path (landmark_to_3d on every point,
+then again on the five key points) with the vectorized array path used by
+HeadMouseTracker.process_loop. No camera or MediaPipe model is needed.
+
+Usage:
+    python benchmarks/bench_landmarks.py --frames 2000
+"""
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from MonitorTracking import HeadMouseTracker, landmarks_to_array, face_frame
+
+
+def fake_landmarks(n, rng):
+    """Build MediaPipe-like landmark objects with x/y/z attributes"""
+    xyz = rng.uniform(0.2, 0.8, size=(n, 3))
+    xyz[:, 2] -= 0.5
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in xyz]
+
+
+def legacy_extract(landmarks, w, h):
+    """Per-frame work of the original process_loop (drawing excluded)"""
+    for i, landmark in enumerate(landmarks):
+        pt = HeadMouseTracker.landmark_to_3d(landmark, w, h)
+        x, y = int(pt[0]), int(pt[1])
+        if 0 <= x < w and 0 <= y < h:
+            _ = i in HeadMouseTracker.FACE_OUTLINE
+
+    points = {}
+    for name, idx in HeadMouseTracker.LANDMARKS.items():
+        points[name] = HeadMouseTracker.landmark_to_3d(landmarks[idx], w, h)
+
+    left, right = points["left"], points["right"]
+    top, bottom, front = points["top"], points["bottom"], points["front"]
+    right_vec = (right - left)
+    right_vec /= np.linalg.norm(right_vec)
+    up_vec = (top - bottom)
+    up_vec /= np.linalg.norm(up_vec)
+    forward_vec = np.cross(right_vec, up_vec)
+    forward_vec /= np.linalg.norm(forward_vec)
+    center = (left + right + top + bottom + front) / 5.0
+    return center, -forward_vec
+
+
+def vectorized_extract(landmarks, w, h, buf, outline_mask):
+    """Per-frame work of the vectorized process_loop (drawing excluded)"""
+    pts3d = landmarks_to_array(landmarks, w, h, out=buf)
+    pix = pts3d[:, :2].astype(np.int32)
+    visible = ((pix[:, 0] >= 0) & (pix[:, 0] < w) &
+               (pix[:, 1] >= 0) & (pix[:, 1] < h))
+    _ = outline_mask[:len(pix)][visible]
+
+    points = pts3d[HeadMouseTracker.KEY_INDICES].astype(np.float64)
+    center, _, _, forward_vec, _, _ = face_frame(points)
+    return center, forward_vec
+
+
+def time_it(fn, frames):
+    """Return mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Landmark extraction micro-benchmark")
+    parser.add_argument("--frames", type=int, default=2000, help="frames to time")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    landmarks = fake_landmarks(HeadMouseTracker.NUM_LANDMARKS, rng)
+    w, h = args.width, args.height
+
+    buf = np.empty((HeadMouseTracker.NUM_LANDMARKS, 3), dtype=np.float32)
+    outline_mask = np.zeros(HeadMouseTracker.NUM_LANDMARKS, dtype=bool)
+    outline_mask[HeadMouseTracker.FACE_OUTLINE] = True
+
+    # Both paths must agree on the pose inputs
+    c_old, f_old = legacy_extract(landmarks, w, h)
+    c_new, f_new = vectorized_extract(landmarks, w, h, buf, outline_mask)
+    assert np.allclose(c_old, c_new, atol=1e-2) and np.allclose(f_old, f_new, atol=1e-4)
+
+    legacy_us = time_it(lambda: legacy_extract(landmarks, w, h), args.frames)
+    vector_us = time_it(lambda: vectorized_extract(landmarks, w, h, buf, outline_mask), args.frames)
+
+    print(f"{len(landmarks)} landmarks, {args.frames} frames")
+    print(f"legacy:     {legacy_us:8.1f} us/frame")
+    print(f"vectorized: {vector_us:8.1f} us/frame")
+    print(f"speedup:    {legacy_us / vector_us:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
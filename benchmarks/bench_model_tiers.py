@@ -0,0 +1,95 @@
+"""Benchmark FaceLandmarkModel tiers on recorded footage
+
+Runs every model tier over the same video and reports inference time,
+face detection rate and head-direction error relative to the refined mesh.
+
+Usage:
+    python benchmarks/bench_model_tiers.py recording.mp4 --max-frames 600
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from MonitorTracking import FaceLandmarkModel, face_frame
+
+
+def load_frames(path, max_frames, width):
+    """Decode up to max_frames RGB frames, downscaled to width if wider"""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open {path}")
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        h, w = frame.shape[:2]
+        if width and w > width:
+            frame = cv2.resize(frame, (width, int(h * width / w)), interpolation=cv2.INTER_AREA)
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    cap.release()
+    return frames
+
+
+def run_tier(tier, frames, args):
+    """Return per-frame inference times and forward vectors (None if no face)"""
+    model = FaceLandmarkModel(
+        tier,
+        min_detection_confidence=args.detection_confidence,
+        min_tracking_confidence=args.tracking_confidence
+    )
+    buf = np.empty((model.num_landmarks, 3), dtype=np.float32)
+    times, directions = [], []
+    try:
+        for rgb in frames:
+            h, w = rgb.shape[:2]
+            start = time.perf_counter()
+            pts = model.process(rgb, out=buf)
+            times.append((time.perf_counter() - start) * 1000.0)
+            if pts is None:
+                directions.append(None)
+                continue
+            points = (pts[model.key_indices] * (w, h, w)).astype(np.float64)
+            directions.append(face_frame(points)[3])
+    finally:
+        model.close()
+    return np.array(times), directions
+
+
+def angle_deg(a, b):
+    """Angle between two unit vectors in degrees"""
+    return np.degrees(np.arccos(np.clip(np.dot(a, b), -1.0, 1.0)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare FaceLandmarkModel tiers")
+    parser.add_argument("video", help="recorded webcam footage")
+    parser.add_argument("--max-frames", type=int, default=600)
+    parser.add_argument("--width", type=int, default=640, help="downscale input to this width")
+    parser.add_argument("--detection-confidence", type=float, default=0.5)
+    parser.add_argument("--tracking-confidence", type=float, default=0.5)
+    args = parser.parse_args()
+
+    frames = load_frames(args.video, args.max_frames, args.width)
+    print(f"{len(frames)} frames from {args.video}")
+
+    results = {tier: run_tier(tier, frames, args) for tier in FaceLandmarkModel.TIERS}
+    _, reference = results["refined"]
+
+    print(f"{'tier':<10} {'p50 ms':>8} {'p95 ms':>8} {'detect %':>9} {'dir err deg':>12}")
+    for tier, (times, directions) in results.items():
+        detected = sum(d is not None for d in directions)
+        errors = [angle_deg(d, r) for d, r in zip(directions, reference)
+                  if d is not None and r is not None]
+        err = f"{np.mean(errors):12.2f}" if errors else f"{'n/a':>12}"
+        print(f"{tier:<10} {np.percentile(times, 50):8.2f} {np.percentile(times, 95):8.2f} "
+              f"{100.0 * detected / max(1, len(frames)):9.1f} {err}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark the full tracking pipeline without a webcam
+
+Drives HeadMouseTracker from a frame source (the synthetic head by
+default, or a video / image directory) into the fake pointer backend and
+prints the per-stage latencies from get_stats(). With --fast, frames are
+played as fast as the pipeline takes them, on a virtual clock, so repeated
+runs see identical input.
+
+Usage:
+    python benchmarks/bench_pipeline.py --frames 600 --fast
+    python benchmarks/bench_pipeline.py --source recording.mp4
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from FrameSources import SyntheticHeadSource, make_frame_source
+from MonitorTracking import HeadMouseTracker
+from PointerBackends import FakePointerBackend
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline tracking pipeline benchmark")
+    parser.add_argument("--source", default="synthetic", help="'synthetic', a video file or an image directory")
+    parser.add_argument("--frames", type=int, default=600, help="synthetic frames to render")
+    parser.add_argument("--fast", action="store_true", help="play as fast as possible")
+    parser.add_argument("--tier", default="refined")
+    args = parser.parse_args()
+
+    if args.source == "synthetic":
+        source = SyntheticHeadSource(frames=args.frames, realtime=not args.fast)
+    else:
+        source = make_frame_source(args.source, realtime=not args.fast)
+
+    pointer = FakePointerBackend()
+    tracker = HeadMouseTracker(
+        source=source,
+        render_mode="off",
+        adaptive_rate=False,
+        model_tier=args.tier,
+        pointer_backend=pointer,
+        hotkeys=False,
+        screen_size=(1920, 1080)
+    )
+    try:
+        tracker.start(block=True)
+    finally:
+        stats = tracker.get_stats()
+        tracker.stop()
+
+    print(f"{source}: {stats['frames']}, {len(pointer.positions)} cursor moves")
+    print(f"{'stage':<12} {'count':>7} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8}  (ms)")
+    for stage, s in stats["latency"].items():
+        if s["count"]:
+            print(f"{stage:<12} {s['count']:7d} {s['mean']:8.2f} {s['p50']:8.2f} {s['p95']:8.2f} {s['p99']:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
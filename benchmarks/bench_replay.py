@@ -0,0 +1,61 @@
+"""Benchmark the post-inference path on a landmark recording
+
+Replays a recording made with HeadMouseTracker(record_path=...) through
+pose, smoothing and screen mapping as fast as possible, and reports the
+throughput, stage latencies and cursor jitter for the chosen filter
+settings.
+
+Usage:
+    python benchmarks/bench_replay.py recordings/session1 --fast-mode --screen 2560x1440
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from LandmarkRecording import LandmarkRecording
+from MonitorTracking import HeadMouseTracker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded landmarks through the tracker")
+    parser.add_argument("recording", help="directory written by the landmark recorder")
+    parser.add_argument("--fast-mode", action="store_true")
+    parser.add_argument("--smoothing", choices=("window", "ema", "none"), default=None)
+    parser.add_argument("--euro-min-cutoff", type=float, default=None)
+    parser.add_argument("--euro-beta", type=float, default=None)
+    parser.add_argument("--realtime", action="store_true", help="keep the recorded frame timing")
+    parser.add_argument("--screen", default="1920x1080", help="screen size WxH the targets map to")
+    args = parser.parse_args()
+    screen_w, screen_h = (int(v) for v in args.screen.lower().split("x"))
+
+    recording = LandmarkRecording(args.recording)
+    tracker = HeadMouseTracker(
+        render_mode="off",
+        fast_mode=args.fast_mode,
+        smoothing=args.smoothing,
+        euro_min_cutoff=args.euro_min_cutoff,
+        euro_beta=args.euro_beta,
+        screen_size=(screen_w, screen_h)
+    )
+
+    start = time.perf_counter()
+    targets = tracker.replay(recording, realtime=args.realtime)
+    elapsed = time.perf_counter() - start
+
+    found = targets[~np.isnan(targets[:, 0])]
+    steps = np.linalg.norm(np.diff(found, axis=0), axis=1) if len(found) > 1 else np.zeros(1)
+    print(f"{len(targets)} frames ({len(found)} with a face) in {elapsed:.2f}s, "
+          f"{len(targets) / max(elapsed, 1e-9):.0f} frames/s")
+    print(f"cursor step px: p50 {np.percentile(steps, 50):.2f}  p95 {np.percentile(steps, 95):.2f}  "
+          f"max {steps.max():.2f}")
+    for stage in ("pose", "filter"):
+        s = tracker.get_stats()["latency"][stage]
+        print(f"{stage:<7} mean {s['mean'] * 1000:.1f} us  p99 {s['p99'] * 1000:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
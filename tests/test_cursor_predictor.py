@@ -0,0 +1,43 @@
+"""Tests for the latency-compensating cursor predictor"""
+import time
+
+import pytest
+
+from MonitorTracking import CursorPredictor
+
+
+def test_velocity_predictor_extrapolates_and_clamps():
+    t0 = time.monotonic()
+    p = CursorPredictor("velocity", horizon=0.0, max_extrapolation=0.1, velocity_alpha=1.0)
+    assert p.predict(t0) is None
+    p.update((0.0, 0.0), t0)
+    p.update((10.0, 0.0), t0 + 0.1)
+    assert p.predict(t0 + 0.15) == pytest.approx([15.0, 0.0])
+    assert p.predict(t0 + 5.0) == pytest.approx([20.0, 0.0])
+    assert p.active(t0 + 0.15)
+    assert not p.active(t0 + 0.3)
+
+
+def test_kalman_predictor_tracks_constant_velocity():
+    t0 = time.monotonic()
+    p = CursorPredictor("kalman")
+    dt = 1 / 30.0
+    for i in range(60):
+        p.update((300.0 * i * dt, 100.0), t0 + i * dt)
+    assert p.vel[0] == pytest.approx(300.0, rel=0.05)
+    assert abs(p.vel[1]) < 5.0
+
+
+def test_predictor_restarts_after_long_gap():
+    t0 = time.monotonic()
+    p = CursorPredictor("velocity", velocity_alpha=1.0)
+    p.update((0.0, 0.0), t0)
+    p.update((10.0, 0.0), t0 + 0.1)
+    p.update((500.0, 500.0), t0 + 2.0)
+    assert p.vel == pytest.approx([0.0, 0.0])
+    assert p.predict(t0 + 2.0) == pytest.approx([500.0, 500.0])
+
+
+def test_predictor_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        CursorPredictor("spline")
@@ -0,0 +1,58 @@
+"""Tests for the latest-frame hand-off slot"""
+import threading
+import time
+
+from MonitorTracking import LatestFrameSlot
+
+
+def test_slot_keeps_newest_and_counts_drops():
+    slot = LatestFrameSlot()
+    slot.put("a", time.monotonic())
+    slot.put("b", time.monotonic())
+    frame, _ = slot.get(timeout=0.1)
+    assert frame == "b"
+    assert slot.stats()["dropped"] == 1
+    assert slot.get(timeout=0.01) == (None, None)
+
+
+def test_slot_counts_stale_frames():
+    slot = LatestFrameSlot(stale_after=0.1)
+    slot.put("old", time.monotonic() - 1.0)
+    assert slot.get(timeout=0.1)[0] == "old"
+    assert slot.stats()["stale"] == 1
+
+
+def test_slot_close_wakes_reader():
+    slot = LatestFrameSlot()
+    threading.Timer(0.05, slot.close).start()
+    assert slot.get(timeout=2.0) == (None, None)
+    assert slot.closed
+
+
+def test_slot_wait_hands_over_every_frame():
+    slot = LatestFrameSlot()
+
+    def writer():
+        for i in range(20):
+            slot.put(i, time.monotonic(), wait=True)
+        slot.close()
+
+    threading.Thread(target=writer, daemon=True).start()
+    received = []
+    while True:
+        frame, _ = slot.get(timeout=2.0)
+        if frame is None:
+            break
+        received.append(frame)
+    assert received == list(range(20))
+    assert slot.stats()["dropped"] == 0
+
+
+def test_slot_reset_clears_counters():
+    slot = LatestFrameSlot()
+    slot.put(1)
+    slot.put(2)
+    slot.close()
+    slot.reset()
+    assert slot.stats() == {"captured": 0, "dropped": 0, "stale": 0}
+    assert not slot.closed
@@ -0,0 +1,37 @@
+"""Tests for the motion-adaptive inference scheduler"""
+import numpy as np
+import pytest
+
+from MonitorTracking import InferenceScheduler
+
+
+def test_scheduler_disabled_always_runs():
+    scheduler = InferenceScheduler(enabled=False, idle_after=2)
+    points = np.zeros((5, 3))
+    for i in range(10):
+        scheduler.record(points, i * 0.01)
+    assert scheduler.next_delay(0.1) == 0.0
+
+
+def test_scheduler_backs_off_when_still_and_recovers_on_motion():
+    scheduler = InferenceScheduler(idle_after=3, motion_threshold=1.0, idle_rate=10.0)
+    points = np.zeros((5, 3))
+    for i in range(4):
+        scheduler.record(points, i * 0.03)
+    assert scheduler.state == InferenceScheduler.STILL
+    assert scheduler.next_delay(0.09) == pytest.approx(0.1)
+
+    scheduler.record(points + 5.0, 0.2)
+    assert scheduler.state == InferenceScheduler.ACTIVE
+    assert scheduler.next_delay(0.2) == 0.0
+
+
+def test_scheduler_drops_to_absent_rate_without_face():
+    scheduler = InferenceScheduler(idle_after=2, absent_rate=2.0)
+    scheduler.record(None, 0.0)
+    scheduler.record(None, 0.1)
+    assert scheduler.state == InferenceScheduler.ABSENT
+    assert scheduler.next_delay(0.1) == pytest.approx(0.5)
+
+    scheduler.record(np.zeros((5, 3)), 0.6)
+    assert scheduler.state == InferenceScheduler.ACTIVE
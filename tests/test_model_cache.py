@@ -0,0 +1,65 @@
+"""Tests for the shared Vosk model cache, with model loading stubbed out"""
+import threading
+
+import pytest
+
+try:
+    import VoiceControl
+except (ImportError, OSError):
+    pytest.skip("vosk or sounddevice unavailable", allow_module_level=True)
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replace load_model with a counter; returns the list of loaded paths"""
+    calls = []
+
+    def fake_load(path):
+        calls.append(path)
+        if path.startswith("missing"):
+            raise RuntimeError(f"no model at {path}")
+        return object()
+
+    monkeypatch.setattr(VoiceControl, "load_model", fake_load)
+    return calls
+
+
+def test_get_loads_once(loads):
+    cache = VoiceControl.ModelCache()
+    assert cache.get("en") is cache.get("en")
+    assert loads == ["en"]
+    assert cache.is_loaded("en")
+
+
+def test_concurrent_preloads_share_one_load(loads):
+    cache = VoiceControl.ModelCache()
+    futures = []
+    threads = [threading.Thread(target=lambda: futures.append(cache.preload("en"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    models = {id(f.result(timeout=5)) for f in futures}
+    assert len(models) == 1
+    assert loads == ["en"]
+
+
+def test_least_recently_used_model_is_evicted(loads):
+    cache = VoiceControl.ModelCache(max_models=2)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+    assert cache.is_loaded("a")
+    assert not cache.is_loaded("b")
+    assert cache.is_loaded("c")
+
+
+def test_failed_load_can_be_retried(loads):
+    cache = VoiceControl.ModelCache()
+    with pytest.raises(RuntimeError):
+        cache.get("missing-model")
+    assert not cache.is_loaded("missing-model")
+    with pytest.raises(RuntimeError):
+        cache.get("missing-model")
+    assert loads == ["missing-model", "missing-model"]
@@ -0,0 +1,49 @@
+"""Tests for the joint 2D One Euro cursor filter"""
+import math
+
+import numpy as np
+import pytest
+
+from MonitorTracking import OneEuroFilter2D
+
+
+def test_one_euro_passes_first_sample_and_holds_constant_input():
+    f = OneEuroFilter2D()
+    assert f.filter((100.0, 50.0), 0.0) == pytest.approx([100.0, 50.0])
+    for i in range(1, 20):
+        out = f.filter((100.0, 50.0), i / 60.0)
+    assert out == pytest.approx([100.0, 50.0])
+
+
+def test_one_euro_smooths_a_step():
+    f = OneEuroFilter2D(min_cutoff=1.0, beta=0.0)
+    f.filter((0.0, 0.0), 0.0)
+    out = f.filter((100.0, 0.0), 1 / 60.0)
+    assert 0.0 < out[0] < 100.0
+    assert out[1] == 0.0
+
+
+def test_one_euro_ignores_non_increasing_timestamps():
+    f = OneEuroFilter2D()
+    f.filter((0.0, 0.0), 1.0)
+    first = f.filter((10.0, 0.0), 1.1)
+    assert f.filter((50.0, 0.0), 1.1) == pytest.approx(first)
+
+
+def test_one_euro_is_direction_independent():
+    axis, diagonal = OneEuroFilter2D(beta=0.05), OneEuroFilter2D(beta=0.05)
+    axis.filter((0.0, 0.0), 0.0)
+    diagonal.filter((0.0, 0.0), 0.0)
+    d = 40.0 / math.sqrt(2.0)
+    for i in range(1, 10):
+        a = axis.filter((40.0 * i, 0.0), i / 30.0)
+        b = diagonal.filter((d * i, d * i), i / 30.0)
+    assert np.hypot(*a) == pytest.approx(np.hypot(*b))
+
+
+def test_one_euro_reset_forgets_state():
+    f = OneEuroFilter2D()
+    f.filter((0.0, 0.0), 0.0)
+    f.filter((10.0, 10.0), 0.1)
+    f.reset()
+    assert f.filter((300.0, 200.0), 5.0) == pytest.approx([300.0, 200.0])
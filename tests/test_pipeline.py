@@ -0,0 +1,127 @@
+"""End-to-end pipeline tests on the synthetic head, without a camera or display"""
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+
+from FrameSources import SyntheticHeadSource
+from MonitorTracking import FaceLandmarkModel, HeadMouseTracker
+from PointerBackends import FakePointerBackend
+
+FRAMES = 90
+
+
+class SyntheticPoseModel:
+    """Stands in for FaceMesh with the synthetic head's exact key points
+
+    Each process() call returns the pose of the next frame, so the tracker
+    has to run inference on every frame, in order.
+    """
+
+    tier = "synthetic"
+    num_landmarks = 5
+    key_indices = np.arange(5)
+
+    def __init__(self, source):
+        self.source = source
+        self.yaws = []
+
+    def process(self, rgb, out=None):
+        src = self.source
+        t = len(self.yaws) / src.fps
+        yaw = src.yaw_amplitude * math.sin(2.0 * math.pi * t / src.period)
+        pitch = src.pitch_amplitude * math.sin(2.0 * math.pi * t / (1.5 * src.period))
+        self.yaws.append(yaw)
+
+        a, b = math.radians(yaw), math.radians(pitch)
+        rot_y = np.array([[math.cos(a), 0, math.sin(a)], [0, 1, 0], [-math.sin(a), 0, math.cos(a)]])
+        rot_x = np.array([[1, 0, 0], [0, math.cos(b), -math.sin(b)], [0, math.sin(b), math.cos(b)]])
+        pts = FaceLandmarkModel.KEY_MODEL @ (rot_x @ rot_y).T * src.head_scale
+        pts[:, 0] += src.width / 2.0
+        pts[:, 1] += src.height / 2.0
+        return (pts / (src.width, src.height, src.width)).astype(np.float32)
+
+    def close(self):
+        pass
+
+    def stats(self):
+        return {"tier": self.tier}
+
+
+def run_pipeline(frames=FRAMES, stub_model=True, restarts=0, **options):
+    """Play the synthetic head through the tracker
+
+    With ``restarts``, the same tracker plays the head again that many times
+    and only the last session's targets are kept. Returns (tracker, pointer,
+    targets, model); model is None for FaceMesh.
+    """
+    source = SyntheticHeadSource(frames=frames, realtime=False)
+    pointer = FakePointerBackend()
+    tracker = HeadMouseTracker(
+        source=source,
+        render_mode="off",
+        adaptive_rate=False,
+        adaptive_resolution=False,
+        roi_crop=not stub_model,
+        pointer_backend=pointer,
+        hotkeys=False,
+        screen_size=(1920, 1080),
+        **options
+    )
+    targets = []
+    publish = tracker.publish_target
+
+    def record_target(x, y, timestamp=None):
+        targets.append((x, y))
+        publish(x, y, timestamp)
+
+    tracker.publish_target = record_target
+    model = None
+    try:
+        for _ in range(restarts + 1):
+            targets.clear()
+            if stub_model:
+                model = tracker.face_model = SyntheticPoseModel(source)
+            tracker.start(block=True)
+    finally:
+        tracker.stop()
+    return tracker, pointer, targets, model
+
+
+def test_offline_source_runs_every_frame():
+    tracker, _, _, _ = run_pipeline(stub_model=False)
+    stats = tracker.get_stats()
+    assert stats["frames"]["captured"] == FRAMES
+    assert stats["frames"]["dropped"] == 0
+    assert stats["latency"]["inference"]["count"] == FRAMES
+
+
+def test_offline_source_is_deterministic():
+    _, _, first, _ = run_pipeline()
+    _, _, second, _ = run_pipeline()
+    assert len(first) == FRAMES
+    assert first == second
+
+
+def test_cursor_follows_head_yaw():
+    _, _, targets, model = run_pipeline(smoothing="none")
+    assert len(targets) == len(model.yaws) == FRAMES
+    xs = np.array([x for x, _ in targets], dtype=np.float64)
+    assert abs(np.corrcoef(xs, model.yaws)[0, 1]) > 0.9
+
+
+def test_restart_forgets_previous_session():
+    _, _, fresh, _ = run_pipeline(frames=30)
+    _, _, restarted, _ = run_pipeline(frames=30, restarts=1)
+    assert restarted == fresh
+
+
+def test_cursor_only_moves_to_published_targets():
+    _, pointer, targets, _ = run_pipeline()
+    assert targets
+    assert pointer.positions
+    published = {(int(x), int(y)) for x, y in targets}
+    assert {(x, y) for x, y, _ in pointer.positions} <= published
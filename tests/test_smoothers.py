@@ -0,0 +1,48 @@
+"""Tests for the head-pose smoothers"""
+import numpy as np
+import pytest
+
+from MonitorTracking import EmaSmoother, PassThroughSmoother, RunningMeanSmoother, make_smoother
+
+
+def test_running_mean_averages_last_window():
+    smoother = RunningMeanSmoother(window=3)
+    outputs = [float(smoother.update([v])[0]) for v in (1, 2, 3, 4, 5)]
+    assert outputs == pytest.approx([1.0, 1.5, 2.0, 3.0, 4.0])
+
+
+def test_running_mean_matches_numpy_over_many_samples():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(500, 6)) * 1000.0
+    smoother = RunningMeanSmoother(window=40)
+    for v in values:
+        out = smoother.update(v)
+    assert out == pytest.approx(values[-40:].mean(axis=0))
+
+
+def test_ema_moves_alpha_towards_new_sample():
+    smoother = EmaSmoother(alpha=0.25)
+    smoother.update([0.0, 0.0])
+    assert smoother.update([4.0, 8.0]) == pytest.approx([1.0, 2.0])
+
+
+def test_ema_rejects_bad_alpha():
+    with pytest.raises(ValueError):
+        EmaSmoother(alpha=0.0)
+
+
+def test_smoother_reports_delay_from_timestamps():
+    smoother = RunningMeanSmoother(window=5)
+    for i in range(10):
+        smoother.update([0.0], timestamp=i * 0.1)
+    stats = smoother.stats()
+    assert stats["kind"] == "window"
+    assert stats["delay_frames"] == 2.0
+    assert stats["delay_ms"] == pytest.approx(200.0)
+
+
+def test_make_smoother():
+    assert isinstance(make_smoother("none"), PassThroughSmoother)
+    assert isinstance(make_smoother("ema", alpha=0.3), EmaSmoother)
+    with pytest.raises(ValueError):
+        make_smoother("median")